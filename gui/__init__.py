@@ -1,9 +1,9 @@
 # Author: Epihaius
 # Date: 2019-09-23
-# Last revision: 2020-10-08
+# Last revision: 2026-10-19
 #
 # This package contains code to create an automatic GUI layout system.
 
 from .gui import GUI
-from .sizer import Sizer
-from .widget import Widget, ScrolledListWidget, ScrolledFrameWidget
+from .sizer import Sizer, StackedSizer
+from .widget import Widget, LazyWidget, ScrolledListWidget, ScrolledFrameWidget, WidgetPool
@@ -1,11 +1,21 @@
 # Author: Epihaius
 # Date: 2019-09-23
+# Last revision: 2026-10-19
 #
 # This package contains code to create an automatic GUI layout system.
 
 from panda3d.core import *
 from direct.showbase.DirectObject import DirectObject
+from direct.showbase.MessengerGlobal import messenger
+from direct.task.TaskManagerGlobal import taskMgr
+from direct.task import Task
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
 from .sizer import Sizer
+from .widget import Widget, LazyWidget
+from .transition import LayoutTransition
+from .registry import Registry
+from .layout_solver import solve_layout, iter_solve_layout, apply_layout
 
 
 class GUI:
@@ -16,20 +26,341 @@ class GUI:
         listener = DirectObject()
         listener.accept("window-event", self.__handle_window_event)
         self.sizer = Sizer("vertical")
+        self._transition = None
+        self._transition_frames = 0
+        self._ui_scale = 1.
+        # threaded layout
+        self._is_layout_threaded = False
+        self._layout_executor = None
+        self._layout_future = None
+        self._layout_size = None
+        self._requested_layout_size = None
+        self._layout_task = None
+        # incremented whenever a layout update gets applied
+        self._layout_count = 0
+
+    @property
+    def threaded_layout(self):
+        """
+        Whether the sizes and positions of the layout are computed in a worker
+        thread.
+
+        If True, `layout` (as well as a window resize) takes a snapshot of the
+        sizer tree (see `Sizer.get_snapshot`) and lays it out in a worker thread,
+        while rendering and input handling continue in the main thread. The
+        results are applied in a single batch at the start of a later frame,
+        after which the changes are reported through the "gui-layout-changed"
+        event. Results are discarded if another layout was requested or if the
+        minimum size of the layout became outdated in the meantime, in which
+        case a new snapshot is laid out.
+
+        """
+
+        return self._is_layout_threaded
+
+    @threaded_layout.setter
+    def threaded_layout(self, threaded):
+
+        self._is_layout_threaded = threaded
+
+        if threaded and not self._layout_executor:
+            self._layout_executor = ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def transition_frames(self):
+
+        return self._transition_frames
+
+    @transition_frames.setter
+    def transition_frames(self, frame_count):
+        """
+        Set the number of frames over which widgets move from their old to
+        their new positions after a layout update (see `LayoutTransition`).
+        A value of zero disables animated transitions.
+        This requires NumPy.
+
+        """
+
+        if frame_count > 0 and not self._transition:
+            self._transition = LayoutTransition()
+        elif frame_count <= 0 and self._transition:
+            self._transition.destroy()
+            self._transition = None
+
+        self._transition_frames = max(0, frame_count)
+
+    def get_object(self, gui_id):
+        """
+        Return the live widget, sizer or sizer cell with the given guiId, or
+        None if there is no such object.
+
+        Note that the objects are looked up in a registry shared by all GUI
+        instances (see `Registry`), so guiIds should be unique across them.
+
+        """
+
+        return Registry.get(gui_id)
+
+    def add_tags(self, obj, *tags):
+        """
+        Add the given tags (any hashable objects) to the given widget, sizer or
+        sizer cell, so it can be looked up through `get_tagged_objects`.
+
+        """
+
+        Registry.add_tags(obj, *tags)
+
+    def remove_tags(self, obj, *tags):
+
+        Registry.remove_tags(obj, *tags)
+
+    def get_tags(self, obj):
+
+        return Registry.get_tags(obj)
+
+    def get_tagged_objects(self, tag):
+        """
+        Return a list of the live widgets, sizers and sizer cells with the given
+        tag.
+
+        """
+
+        return Registry.get_tagged(tag)
+
+    def get_ui_scale(self):
+
+        return self._ui_scale
+
+    def set_ui_scale(self, factor):
+        """
+        Scale the entire GUI by the given factor, e.g. for accessibility or to
+        adapt to a HiDPI display.
+
+        Rather than rescaling all widget metrics, borders, gaps and default
+        sizes, the pixel2d node is scaled, such that all layout computations
+        remain in the same (logical) units and nothing needs to be measured
+        anew; the layout is updated in a single pass to fit the window size
+        divided by the given factor, returning the same list of changes as
+        `layout`.
+        Widgets need to be parented (directly or not) to pixel2d.
+
+        """
+
+        self._ui_scale = factor
+        self.__apply_ui_scale()
+
+        return self.layout()
+
+    def __apply_ui_scale(self):
+
+        win_props = self._showbase.win.get_properties()
+        w = win_props.get_x_size()
+        h = win_props.get_y_size()
+
+        if w > 0 and h > 0:
+            factor = self._ui_scale
+            self._showbase.pixel2d.set_scale(2. * factor / w, 1., 2. * factor / h)
+
+    def __get_logical_size(self, w, h):
+
+        factor = self._ui_scale
+
+        return (max(1, int(w / factor)), max(1, int(h / factor)))
 
     def layout(self):
+        """
+        Update the layout to fit the window.
+
+        Return a list of (widget, old_rect, new_rect) tuples for the widgets
+        whose position and/or size changed since the previous layout pass (see
+        `Widget.get_rect`). If not empty, this list is also sent along with a
+        "gui-layout-changed" event.
+        If `threaded_layout` is True, an empty list is returned instead, as the
+        layout is updated at a later frame; the changes are then only sent
+        along with the event.
+
+        """
 
         win_props = self._showbase.win.get_properties()
         w = win_props.get_x_size()
         h = win_props.get_y_size()
         self._window_size = (w, h)
+
+        return self.__update_layout(*self.__get_logical_size(w, h))
+
+    def layout_async(self, time_slice=2000):
+        """
+        Update the layout to fit the window, spreading the computation over
+        multiple frames, such that about `time_slice` microseconds are spent
+        on it per frame.
+
+        The minimum sizes, the snapshot of the sizer tree and the layout itself
+        are computed cell by cell, pausing whenever the time slice is used up;
+        only the minimum size of each sizer is computed from those of its cells
+        in one go, which may exceed the time slice for a sizer with very many
+        cells.
+        The computed sizes and positions are only applied when the computation
+        is finished, all at once within a single frame, so a partially updated
+        layout is never shown; only widgets whose size changed get resized.
+        Widgets are resized through their own `set_size` method once the layout
+        of their sizers has been applied, so widgets that adapt their contents
+        to that layout (e.g. a `ScrolledListWidget` updating the items in view)
+        end up in the same state as after a call to `layout`.
+        If the layout got updated by other means in the meantime, or anything
+        changed that affects its minimum size, the computation starts over.
+        Return a task that can be awaited in a coroutine, resulting in the same
+        list of changes as returned by `layout`.
+
+        """
+
+        return taskMgr.add(self.__layout_in_slices(time_slice * 1e-6),
+            "gui_layout_async")
+
+    async def __layout_in_slices(self, time_slice):
+
+        while True:
+
+            win_props = self._showbase.win.get_properties()
+            w = win_props.get_x_size()
+            h = win_props.get_y_size()
+            layout_count = self._layout_count
+            solver = self.__iter_layout(self.__get_logical_size(w, h))
+            end_time = perf_counter() + time_slice
+
+            while True:
+
+                try:
+                    next(solver)
+                except StopIteration as e:
+                    size_ops, pos_ops = e.value
+                    break
+
+                if perf_counter() > end_time:
+                    await Task.pause(0.)
+                    end_time = perf_counter() + time_slice
+
+            if self._layout_count != layout_count or self.sizer.is_min_size_stale:
+                continue
+
+            self._window_size = (w, h)
+            apply_layout(size_ops, pos_ops)
+
+            # lazy widgets may have been realized and wrapping sizers or
+            # height-for-width widgets may have been reflowed, requiring
+            # another pass
+            if LazyWidget.pop_layout_stale() or self.sizer.is_min_size_stale:
+                continue
+
+            return self.__finish_layout()
+
+    def __iter_layout(self, size):
+        """
+        Return a generator computing the layout of the sizer tree for the given
+        size in small steps (see `layout_async`), returning the same lists of
+        operations as `layout_solver.iter_solve_layout`.
+
+        """
+
+        yield from self.sizer.iter_update_min_size()
+        snapshot = yield from self.sizer.iter_snapshot()
+
+        return (yield from iter_solve_layout(snapshot, size))
+
+    def __update_layout(self, w, h):
+
+        if self._is_layout_threaded:
+            self.__request_threaded_layout((w, h))
+            return []
+
         self.sizer.update((w, h))
 
+        # lazy widgets realized during the layout update may need a different
+        # size than was estimated for them
+        while LazyWidget.pop_layout_stale():
+            self.sizer.update((w, h))
+
+        return self.__finish_layout()
+
+    def __request_threaded_layout(self, size):
+
+        self._requested_layout_size = size
+
+        if not self._layout_future:
+            self.__submit_threaded_layout()
+
+    def __submit_threaded_layout(self):
+
+        self._layout_size = size = self._requested_layout_size
+        self._requested_layout_size = None
+        # minimum sizes need to be computed in the main thread, as they depend
+        # on the DirectGui objects
+        self.sizer.update_min_size()
+        snapshot = self.sizer.get_snapshot()
+        self._layout_future = self._layout_executor.submit(solve_layout, snapshot, size)
+
+        if not self._layout_task:
+            self._layout_task = taskMgr.add(self.__check_threaded_layout,
+                "gui_threaded_layout", sort=-10)
+
+    def __check_threaded_layout(self, task):
+
+        future = self._layout_future
+
+        if not future.done():
+            return task.cont
+
+        self._layout_future = None
+        size_ops, pos_ops = future.result()
+
+        # the results are outdated if a new layout was requested in the meantime
+        # or if anything changed that affects the minimum size of the layout
+        if self._requested_layout_size is None and not self.sizer.is_min_size_stale:
+
+            apply_layout(size_ops, pos_ops)
+
+            # lazy widgets may have been realized and wrapping sizers or
+            # height-for-width widgets may have been reflowed, requiring
+            # another pass
+            if LazyWidget.pop_layout_stale() or self.sizer.is_min_size_stale:
+                self._requested_layout_size = self._layout_size
+
+            self.__finish_layout()
+
+        elif self._requested_layout_size is None:
+
+            self._requested_layout_size = self._layout_size
+
+        if self._requested_layout_size:
+            self.__submit_threaded_layout()
+            return task.cont
+
+        self._layout_task = None
+
+        return task.done
+
+    def __finish_layout(self):
+
+        self._layout_count += 1
+        changes = Widget.pop_rect_changes()
+
+        if changes and self._transition:
+            self._transition.start(changes, self._transition_frames)
+
+        if changes:
+            messenger.send("gui-layout-changed", [changes])
+
+        return changes
+
     def __handle_window_event(self, window):
 
         win_props = window.get_properties()
         w, h = max(1, win_props.get_x_size()), max(1, win_props.get_y_size())
 
+        if self._ui_scale != 1.:
+            # the scale of pixel2d gets reset by ShowBase when the window
+            # is resized
+            self.__apply_ui_scale()
+
         if self._window_size != (w, h):
 
             self._window_size = (w, h)
@@ -37,6 +368,7 @@ class GUI:
             win_props.set_size(w, h)
             window.request_properties(win_props)
 
+            w, h = self.__get_logical_size(w, h)
             w_min, h_min = self.sizer.update_min_size()
 
             if w < w_min:
@@ -45,4 +377,4 @@ class GUI:
             if h < h_min:
                 h = h_min
 
-            self.sizer.update((w, h))
+            self.__update_layout(w, h)
@@ -0,0 +1,498 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains a list-like container that allows fast insertion,
+# removal and lookup of items, both by index and by the items themselves, as
+# well as by their accumulated weights (e.g. heights).
+
+from collections.abc import MutableSequence
+
+
+class _Chunk(list):
+
+    __slots__ = ("ordinal", "weight")
+
+
+class IndexedList(MutableSequence):
+    """
+    A sequence of unique, hashable items, supporting insertion, removal and
+    lookup by index, as well as retrieval of the index of an item, in
+    (amortized) logarithmic time.
+
+    The items are stored in chunks of limited length; a Fenwick tree of the
+    chunk lengths allows the chunk containing the item at any given index to
+    be found quickly, while a dictionary maps each item to its chunk.
+
+    If a weight function is given (a callable taking an item and returning a
+    number, e.g. its height), a second Fenwick tree of the summed weights of
+    the chunks allows the sum of the weights of the items up to any index,
+    as well as the index of the item at any accumulated weight (e.g. the item
+    at a given vertical offset), to be found quickly as well.
+
+    """
+
+    # the length of newly created chunks; a chunk gets split in two when its
+    # length exceeds twice this value
+    _chunk_length = 256
+
+    def __init__(self, items=(), weight=None):
+
+        self._weight = weight
+        self.__reset(list(items))
+
+    def __reset(self, items):
+
+        chunk_length = self._chunk_length
+        self._chunks = chunks = []
+        self._item_chunks = item_chunks = {}
+        self._item_weights = item_weights = {}
+        weight = self._weight
+
+        for i in range(0, len(items), chunk_length):
+
+            chunk = _Chunk(items[i:i+chunk_length])
+            chunk.weight = 0
+            chunks.append(chunk)
+
+            for item in chunk:
+                item_chunks[item] = chunk
+
+            if weight:
+                for item in chunk:
+                    item_weights[item] = w = weight(item)
+                    chunk.weight += w
+
+        if len(item_chunks) < len(items):
+            self.__reset([])
+            raise ValueError("IndexedList items must be unique.")
+
+        self._length = len(items)
+        self.__rebuild_tree()
+
+    def __rebuild_tree(self):
+
+        chunks = self._chunks
+        count = len(chunks)
+        self._tree = tree = [0] * (count + 1)
+
+        for i, chunk in enumerate(chunks):
+            chunk.ordinal = i
+            tree[i+1] = len(chunk)
+
+        for i in range(1, count + 1):
+
+            j = i + (i & -i)
+
+            if j <= count:
+                tree[j] += tree[i]
+
+        # the largest power of two not exceeding the number of chunks
+        self._tree_step = 1 << (count.bit_length() - 1) if count else 0
+
+        if not self._weight:
+            return
+
+        self._weight_tree = weight_tree = [0] * (count + 1)
+
+        for i, chunk in enumerate(chunks):
+            weight_tree[i+1] = chunk.weight
+
+        for i in range(1, count + 1):
+
+            j = i + (i & -i)
+
+            if j <= count:
+                weight_tree[j] += weight_tree[i]
+
+        self._total_weight = sum(chunk.weight for chunk in chunks)
+
+    def __update_tree(self, chunk_index, delta):
+
+        tree = self._tree
+        count = len(tree) - 1
+        i = chunk_index + 1
+
+        while i <= count:
+            tree[i] += delta
+            i += i & -i
+
+    def __update_weight(self, chunk, delta):
+
+        chunk.weight += delta
+        self._total_weight += delta
+        tree = self._weight_tree
+        count = len(tree) - 1
+        i = chunk.ordinal + 1
+
+        while i <= count:
+            tree[i] += delta
+            i += i & -i
+
+    def __get_chunk_start(self, chunk_index):
+        """
+        Return the index of the first item in the chunk with the given index.
+
+        """
+
+        tree = self._tree
+        start = 0
+        i = chunk_index
+
+        while i > 0:
+            start += tree[i]
+            i -= i & -i
+
+        return start
+
+    def __locate(self, index):
+        """
+        Return the chunk containing the item at the given (non-negative and
+        valid) index, together with the index of that item within the chunk.
+
+        """
+
+        tree = self._tree
+        count = len(tree) - 1
+        pos = 0
+        step = self._tree_step
+
+        while step:
+
+            next_pos = pos + step
+
+            if next_pos <= count and tree[next_pos] <= index:
+                pos = next_pos
+                index -= tree[pos]
+
+            step >>= 1
+
+        return self._chunks[pos], index
+
+    def __normalize_index(self, index):
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("IndexedList index out of range")
+
+        return index
+
+    def __len__(self):
+
+        return self._length
+
+    def __iter__(self):
+
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __reversed__(self):
+
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def __contains__(self, item):
+
+        return item in self._item_chunks
+
+    def __repr__(self):
+
+        return "IndexedList({})".format(list(self))
+
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+
+            start, stop, step = index.indices(self._length)
+
+            if step != 1:
+                return list(self)[index]
+
+            items = []
+
+            if start >= stop:
+                return items
+
+            chunk, i = self.__locate(start)
+            count = stop - start
+            chunks = self._chunks
+
+            while True:
+
+                items.extend(chunk[i:i+count-len(items)])
+
+                if len(items) == count:
+                    return items
+
+                chunk = chunks[chunk.ordinal+1]
+                i = 0
+
+        chunk, i = self.__locate(self.__normalize_index(index))
+
+        return chunk[i]
+
+    def __setitem__(self, index, item):
+
+        if isinstance(index, slice):
+            items = list(self)
+            items[index] = item
+            self.__reset(items)
+            return
+
+        chunk, i = self.__locate(self.__normalize_index(index))
+        old_item = chunk[i]
+
+        if item == old_item:
+            return
+
+        if item in self._item_chunks:
+            raise ValueError("IndexedList items must be unique.")
+
+        del self._item_chunks[old_item]
+        self._item_chunks[item] = chunk
+        chunk[i] = item
+
+        if self._weight:
+            old_weight = self._item_weights.pop(old_item)
+            self._item_weights[item] = w = self._weight(item)
+            self.__update_weight(chunk, w - old_weight)
+
+    def __delitem__(self, index):
+
+        if isinstance(index, slice):
+            items = list(self)
+            del items[index]
+            self.__reset(items)
+            return
+
+        chunk, i = self.__locate(self.__normalize_index(index))
+        self.__remove_from_chunk(chunk, i)
+
+    def __remove_from_chunk(self, chunk, i):
+
+        item = chunk.pop(i)
+        del self._item_chunks[item]
+        self._length -= 1
+
+        if self._weight:
+            self.__update_weight(chunk, -self._item_weights.pop(item))
+
+        if chunk:
+            self.__update_tree(chunk.ordinal, -1)
+        else:
+            del self._chunks[chunk.ordinal]
+            self.__rebuild_tree()
+
+    def insert(self, index, item):
+
+        if item in self._item_chunks:
+            raise ValueError("IndexedList items must be unique.")
+
+        length = self._length
+
+        if index < 0:
+            index = max(0, index + length)
+        elif index > length:
+            index = length
+
+        if not self._chunks:
+            chunk = _Chunk()
+            chunk.weight = 0
+            self._chunks.append(chunk)
+            self.__rebuild_tree()
+            i = 0
+        elif index == length:
+            chunk = self._chunks[-1]
+            i = len(chunk)
+        else:
+            chunk, i = self.__locate(index)
+
+        chunk.insert(i, item)
+        self._item_chunks[item] = chunk
+        self._length += 1
+
+        if self._weight:
+            self._item_weights[item] = w = self._weight(item)
+            self.__update_weight(chunk, w)
+
+        if len(chunk) > 2 * self._chunk_length:
+            self.__split_chunk(chunk)
+        else:
+            self.__update_tree(chunk.ordinal, 1)
+
+    def __split_chunk(self, chunk):
+
+        chunk_length = self._chunk_length
+        new_chunk = _Chunk(chunk[chunk_length:])
+        del chunk[chunk_length:]
+        item_chunks = self._item_chunks
+
+        for item in new_chunk:
+            item_chunks[item] = new_chunk
+
+        if self._weight:
+            item_weights = self._item_weights
+            new_chunk.weight = sum(item_weights[item] for item in new_chunk)
+            chunk.weight -= new_chunk.weight
+        else:
+            new_chunk.weight = 0
+
+        self._chunks.insert(chunk.ordinal + 1, new_chunk)
+        self.__rebuild_tree()
+
+    def append(self, item):
+
+        self.insert(self._length, item)
+
+    def extend(self, items):
+
+        if self._length:
+            for item in items:
+                self.insert(self._length, item)
+        else:
+            self.__reset(list(items))
+
+    def remove(self, item):
+
+        chunk = self._item_chunks.get(item)
+
+        if chunk is None:
+            raise ValueError("IndexedList.remove(x): x not in list")
+
+        self.__remove_from_chunk(chunk, chunk.index(item))
+
+    def pop(self, index=-1):
+
+        chunk, i = self.__locate(self.__normalize_index(index))
+        item = chunk[i]
+        self.__remove_from_chunk(chunk, i)
+
+        return item
+
+    def clear(self):
+
+        self.__reset([])
+
+    def index(self, item, start=0, stop=None):
+
+        chunk = self._item_chunks.get(item)
+
+        if chunk is None:
+            raise ValueError("{!r} is not in IndexedList".format(item))
+
+        index = self.__get_chunk_start(chunk.ordinal) + chunk.index(item)
+        start, stop, _ = slice(start, stop).indices(self._length)
+
+        if not start <= index < stop:
+            raise ValueError("{!r} is not in IndexedList".format(item))
+
+        return index
+
+    def count(self, item):
+
+        return 1 if item in self._item_chunks else 0
+
+    def move(self, item, index):
+        """
+        Move the given item to the given index.
+
+        """
+
+        self.remove(item)
+        self.insert(index, item)
+
+    @property
+    def weight_sum(self):
+        """
+        The sum of the weights of all items (see `IndexedList`).
+
+        """
+
+        return self._total_weight if self._weight else 0
+
+    def get_weight(self, item):
+
+        return self._item_weights[item]
+
+    def update_weight(self, item):
+        """
+        Compute the weight of the given item anew, e.g. after its height changed.
+
+        """
+
+        chunk = self._item_chunks[item]
+        old_weight = self._item_weights[item]
+        self._item_weights[item] = w = self._weight(item)
+        self.__update_weight(chunk, w - old_weight)
+
+    def get_weight_sum(self, stop):
+        """
+        Return the sum of the weights of the items with an index smaller than
+        the given one.
+
+        """
+
+        if stop >= self._length:
+            return self.weight_sum
+
+        if stop <= 0:
+            return 0
+
+        chunk, i = self.__locate(stop)
+        tree = self._weight_tree
+        weight_sum = 0
+        j = chunk.ordinal
+
+        while j > 0:
+            weight_sum += tree[j]
+            j -= j & -j
+
+        item_weights = self._item_weights
+
+        return weight_sum + sum(item_weights[item] for item in chunk[:i])
+
+    def get_index_at_weight(self, weight_sum):
+        """
+        Return the index of the item at the given accumulated weight, i.e. the
+        first item for which the sum of its weight and the weights of all items
+        before it exceeds the given value.
+        If the given value is not smaller than the sum of all weights, the
+        length of this list is returned.
+
+        """
+
+        if weight_sum >= self.weight_sum:
+            return self._length
+
+        if weight_sum < 0:
+            return 0
+
+        tree = self._weight_tree
+        count = len(tree) - 1
+        pos = 0
+        step = self._tree_step
+
+        while step:
+
+            next_pos = pos + step
+
+            if next_pos <= count and tree[next_pos] <= weight_sum:
+                pos = next_pos
+                weight_sum -= tree[pos]
+
+            step >>= 1
+
+        chunk = self._chunks[pos]
+        item_weights = self._item_weights
+
+        for i, item in enumerate(chunk):
+
+            weight = item_weights[item]
+
+            if weight_sum < weight:
+                break
+
+            weight_sum -= weight
+
+        return self.__get_chunk_start(pos) + i
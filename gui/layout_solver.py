@@ -0,0 +1,373 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains the pure functions that compute the sizes and positions
+# of the rows, columns and cells of sizers, as well as a solver that lays out
+# an immutable snapshot of a sizer tree without touching any of its objects,
+# such that it can safely run in a thread other than the main thread.
+
+from collections import namedtuple
+
+
+# an immutable description of a sizer; if `is_leaf` is True, the sizer is not
+# laid out by the solver itself, but by the sizer object when the results get
+# applied (this is the case for sizers in wrap mode)
+SizerSnapshot = namedtuple("SizerSnapshot", ("sizer", "is_leaf", "prim_dim",
+    "rows", "gaps", "min_size", "explicit_proportions", "default_proportions",
+    "pos"))
+# an immutable description of a sizer cell; `obj_min_size` is the minimum size
+# of its object (None for a cell containing just a size), `obj_size` is the
+# size last applied to the frame of its widget (None if unknown or if the widget
+# needs to be resized in any case), while `sizer` is the SizerSnapshot of the
+# sizer it contains or of the sizer of its widget, if any
+CellSnapshot = namedtuple("CellSnapshot", ("cell", "type", "obj", "min_size",
+    "obj_min_size", "obj_size", "proportions", "alignments", "borders", "sizer"))
+
+# the kinds of operations that apply the results of the solver
+CELL_LAYOUT = 0
+SIZER_SIZE = 1
+WIDGET_SIZE = 2
+LEAF_SIZE = 3
+SIZER_POS = 4
+WIDGET_POS = 5
+LEAF_POS = 6
+
+
+def get_track_min_sizes(rows, prim_dim):
+    """
+    Return the minimum sizes of the columns and rows made up by the given
+    rows (horizontal growth) or columns of cells (or cell snapshots).
+
+    """
+
+    min_sizes = [None, None]
+    min_sizes[prim_dim] = prim_min_sizes = [0] * (len(rows[0]) if rows else 0)
+    min_sizes[1-prim_dim] = sec_min_sizes = []
+
+    for row in rows:
+
+        sec_min_size = 0
+
+        for i, cell in enumerate(row):
+            min_size = cell.min_size
+            prim_min_sizes[i] = max(prim_min_sizes[i], min_size[prim_dim])
+            sec_min_size = max(sec_min_size, min_size[1-prim_dim])
+
+        sec_min_sizes.append(sec_min_size)
+
+    return min_sizes
+
+
+def get_track_proportions(rows, prim_dim, explicit_proportions, default_proportions):
+    """
+    Return the proportions of the columns and rows made up by the given rows
+    (horizontal growth) or columns of cells (or cell snapshots).
+
+    The proportion of a column or row is the one explicitly set for it, if
+    any; otherwise, it is the largest proportion associated with its cells or,
+    if that is negative, the given default proportion.
+
+    """
+
+    proportions = [None, None]
+    proportions[prim_dim] = prim_proportions = [-1.] * (len(rows[0]) if rows else 0)
+    proportions[1-prim_dim] = sec_proportions = []
+
+    for row in rows:
+
+        sec_proportion = -1.
+
+        for i, cell in enumerate(row):
+            prim_proportions[i] = max(prim_proportions[i], cell.proportions[prim_dim])
+            sec_proportion = max(sec_proportion, cell.proportions[1-prim_dim])
+
+        sec_proportions.append(sec_proportion)
+
+    for dim in (prim_dim, 1-prim_dim):
+        default_p = default_proportions[dim]
+        explicit_p = explicit_proportions[dim]
+        proportions[dim] = [explicit_p.get(i, default_p if p < 0. else p)
+            for i, p in enumerate(proportions[dim])]
+
+    return proportions
+
+
+def distribute_size(proportions, min_sizes, sizes, total_size):
+    """
+    Distribute the given total size over the given sizes, according to the
+    given proportions, while respecting the given minimum sizes.
+
+    """
+
+    indices_to_check = list(range(len(sizes)))
+
+    # without any proportions, each size simply equals the minimum size
+    if not any(proportions):
+        sizes[:] = min_sizes
+        return
+
+    # whenever a size would be smaller than the corresponding minimum size,
+    # it is set to that minimum size and the remaining space is distributed
+    # anew over the sizes still to be determined
+    while indices_to_check:
+
+        p_sum = sum(proportions[i] for i in indices_to_check)
+        tmp_size = total_size
+
+        for j, i in enumerate(indices_to_check):
+
+            proportion = proportions[i]
+            min_size = min_sizes[i]
+
+            if p_sum == 0.:
+                p_sum = 1.
+
+            new_size = int(round(tmp_size * min(1., proportion / p_sum)))
+
+            if new_size < min_size:
+                total_size -= min_size
+                sizes[i] = min_size
+                del indices_to_check[j]
+                break
+
+            sizes[i] = new_size
+            tmp_size -= new_size
+            p_sum -= proportion
+
+        else:
+
+            break
+
+
+def get_track_sizes(size, gaps, prim_dim, min_sizes_by_dim, proportions_by_dim):
+    """
+    Distribute the given size, minus the given gaps, over the columns and rows
+    with the given minimum sizes and proportions.
+
+    """
+
+    dim_sizes = [None, None]
+
+    for dim in (prim_dim, 1-prim_dim):
+        min_sizes = min_sizes_by_dim[dim]
+        count = len(min_sizes)
+        dim_sizes[dim] = sizes = [0] * count
+        total_size = size[dim] - gaps[dim] * max(0, count - 1)
+        distribute_size(proportions_by_dim[dim], min_sizes, sizes, total_size)
+
+    return dim_sizes
+
+
+def get_cell_layout(size, obj_min_size, alignments, borders, prim_dim):
+    """
+    Return the size of the object in a cell of the given size, as well as the
+    offset of that object within the cell.
+
+    """
+
+    width, height = size
+    size = [width, height]
+    offset = [0, 0]
+    l, r, b, t = borders
+    size[0] -= l + r
+    size[1] -= t + b
+    offset[0] += l
+    offset[1] += t
+    w, h = obj_min_size
+    new_size = [w, h]
+
+    if alignments[prim_dim] == "max":
+        offset[prim_dim] += size[prim_dim] - new_size[prim_dim]
+    elif alignments[prim_dim] == "center":
+        offset[prim_dim] += (size[prim_dim] - new_size[prim_dim]) // 2
+
+    if alignments[1-prim_dim] == "max":
+        offset[1-prim_dim] += size[1-prim_dim] - new_size[1-prim_dim]
+    elif alignments[1-prim_dim] == "center":
+        offset[1-prim_dim] += (size[1-prim_dim] - new_size[1-prim_dim]) // 2
+
+    if alignments[prim_dim] == "expand":
+        new_size[prim_dim] = size[prim_dim]
+    if alignments[1-prim_dim] == "expand":
+        new_size[1-prim_dim] = size[1-prim_dim]
+
+    return tuple(new_size), tuple(offset)
+
+
+def _solve_sizes(snapshot, size, size_ops, cell_layouts):
+
+    width, height = size
+    w_min, h_min = snapshot.min_size
+    size = (max(w_min, width), max(h_min, height))
+
+    if snapshot.is_leaf:
+        size_ops.append((LEAF_SIZE, snapshot.sizer, size))
+        return
+
+    size_ops.append((SIZER_SIZE, snapshot.sizer, size))
+    rows = snapshot.rows
+
+    if not rows:
+        return
+
+    prim_dim = snapshot.prim_dim
+    min_sizes_by_dim = get_track_min_sizes(rows, prim_dim)
+    proportions_by_dim = get_track_proportions(rows, prim_dim,
+        snapshot.explicit_proportions, snapshot.default_proportions)
+    dim_sizes = get_track_sizes(size, snapshot.gaps, prim_dim, min_sizes_by_dim,
+        proportions_by_dim)
+    cell_size = [0, 0]
+
+    for row, sec_size in zip(rows, dim_sizes[1-prim_dim]):
+
+        cell_size[1-prim_dim] = sec_size
+
+        for cell, prim_size in zip(row, dim_sizes[prim_dim]):
+            cell_size[prim_dim] = prim_size
+            yield from _solve_cell_size(cell, tuple(cell_size), prim_dim, size_ops,
+                cell_layouts)
+            # allow the solver to be suspended after each cell (see
+            # `iter_solve_layout`)
+            yield
+
+
+def _solve_cell_size(snapshot, size, prim_dim, size_ops, cell_layouts):
+
+    if snapshot.type == "size":
+        offset = (0, 0)
+    else:
+
+        obj_size, offset = get_cell_layout(size, snapshot.obj_min_size,
+            snapshot.alignments, snapshot.borders, prim_dim)
+
+        if snapshot.type == "widget":
+            width, height = obj_size
+            w_min, h_min = snapshot.obj_min_size
+            obj_size = (max(w_min, width), max(h_min, height))
+
+        if snapshot.sizer:
+            yield from _solve_sizes(snapshot.sizer, obj_size, size_ops, cell_layouts)
+
+        # a widget is resized after the layout of its sizer has been applied,
+        # as it may need to adapt to that layout (see `Widget.set_size`);
+        # resizing a widget whose frame already has the computed size is
+        # skipped, as it is relatively costly
+        if snapshot.type == "widget" and obj_size != snapshot.obj_size:
+            size_ops.append((WIDGET_SIZE, snapshot.obj, obj_size))
+
+    size_ops.append((CELL_LAYOUT, snapshot.cell, size, offset))
+    cell_layouts[snapshot.cell] = (size, offset)
+
+
+def _solve_positions(snapshot, pos, pos_ops, cell_layouts):
+
+    prim_dim = snapshot.prim_dim
+    start_pos = list(pos)
+    start_coord = start_pos[prim_dim]
+    gaps = snapshot.gaps
+
+    for row in snapshot.rows:
+
+        start_pos[prim_dim] = start_coord
+
+        for cell in row:
+
+            size, (offset_x, offset_y) = cell_layouts[cell.cell]
+            pos = (start_pos[0] + offset_x, start_pos[1] + offset_y)
+            sizer = cell.sizer
+
+            if cell.type == "widget":
+
+                pos_ops.append((WIDGET_POS, cell.obj, pos))
+
+                if sizer and sizer.is_leaf:
+                    pos_ops.append((LEAF_POS, sizer.sizer, sizer.pos))
+                elif sizer:
+                    yield from _solve_positions(sizer, sizer.pos, pos_ops, cell_layouts)
+
+            elif cell.type == "sizer":
+
+                if sizer.is_leaf:
+                    pos_ops.append((LEAF_POS, sizer.sizer, pos))
+                else:
+                    pos_ops.append((SIZER_POS, sizer.sizer, pos))
+                    yield from _solve_positions(sizer, pos, pos_ops, cell_layouts)
+
+            start_pos[prim_dim] += size[prim_dim] + gaps[prim_dim]
+
+            yield
+
+        start_pos[1-prim_dim] += size[1-prim_dim] + gaps[1-prim_dim]
+
+
+def iter_solve_layout(snapshot, size):
+    """
+    Return a generator computing the layout of the sizer described by the
+    given snapshot (see `Sizer.get_snapshot`), when given the specified size.
+
+    The generator yields after each cell it processed, allowing the
+    computation to be spread over multiple frames. When finished, it returns
+    (as the value of its StopIteration) a list of operations setting sizes and
+    a list of operations setting positions, to be applied in order (see
+    `apply_layout`).
+    The solver does not access any of the objects referenced by the snapshot,
+    so it can run in any thread.
+
+    """
+
+    size_ops = []
+    pos_ops = []
+    cell_layouts = {}
+    yield from _solve_sizes(snapshot, size, size_ops, cell_layouts)
+
+    if snapshot.is_leaf:
+        pos_ops.append((LEAF_POS, snapshot.sizer, snapshot.pos))
+    else:
+        yield from _solve_positions(snapshot, snapshot.pos, pos_ops, cell_layouts)
+
+    return size_ops, pos_ops
+
+
+def solve_layout(snapshot, size):
+    """
+    Compute the layout of the sizer described by the given snapshot in one go.
+    See `iter_solve_layout`.
+
+    """
+
+    solver = iter_solve_layout(snapshot, size)
+
+    try:
+        while True:
+            next(solver)
+    except StopIteration as e:
+        return e.value
+
+
+def apply_layout(size_ops, pos_ops):
+    """
+    Apply the results computed by `solve_layout` to the sizers, cells and
+    widgets they refer to. This needs to be done in the main thread.
+
+    """
+
+    for op in size_ops:
+
+        kind, obj = op[:2]
+
+        if kind == CELL_LAYOUT:
+            obj.set_layout(*op[2:])
+        elif kind == SIZER_SIZE:
+            obj.set_size(op[2], force=True)
+        elif kind == WIDGET_SIZE:
+            # the sizer of a widget is laid out by the solver itself
+            obj.set_size(op[2], force=True)
+        elif kind == LEAF_SIZE:
+            obj.set_size(op[2])
+
+    for kind, obj, pos in pos_ops:
+
+        obj.set_pos(pos)
+
+        if kind == LEAF_POS:
+            obj.update_positions()
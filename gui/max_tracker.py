@@ -0,0 +1,87 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains a multiset of values that keeps track of its maximum.
+
+from heapq import heappush, heappop, heapify
+
+
+class MaxTracker:
+    """
+    A multiset of comparable, hashable values (e.g. the widths of list items),
+    allowing values to be added and removed, as well as the largest value to
+    be retrieved, in (amortized) logarithmic time.
+
+    The count of each value is kept in a dictionary, while a heap of the
+    distinct values yields the maximum; values that are no longer present are
+    only discarded from the heap when they end up at its top.
+
+    """
+
+    def __init__(self, values=()):
+
+        self._counts = {}
+        self._heap = []
+        self._length = 0
+
+        for value in values:
+            self.add(value)
+
+    def __len__(self):
+
+        return self._length
+
+    def __contains__(self, value):
+
+        return value in self._counts
+
+    def add(self, value):
+
+        count = self._counts.get(value, 0)
+        self._counts[value] = count + 1
+        self._length += 1
+
+        if not count:
+            heappush(self._heap, -value)
+
+    def remove(self, value):
+
+        count = self._counts.get(value)
+
+        if count is None:
+            raise ValueError("MaxTracker.remove(x): x not in tracker")
+
+        self._length -= 1
+
+        if count > 1:
+            self._counts[value] = count - 1
+            return
+
+        del self._counts[value]
+
+        # prevent the heap from filling up with values that were removed (and
+        # possibly added again) without ever reaching its top
+        if len(self._heap) > 2 * len(self._counts) + 16:
+            self._heap = [-v for v in self._counts]
+            heapify(self._heap)
+
+    def clear(self):
+
+        self._counts = {}
+        self._heap = []
+        self._length = 0
+
+    @property
+    def max(self):
+        """
+        The largest value, or None if there are no values.
+
+        """
+
+        heap = self._heap
+        counts = self._counts
+
+        while heap and -heap[0] not in counts:
+            heappop(heap)
+
+        return -heap[0] if heap else None
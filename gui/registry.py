@@ -0,0 +1,141 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains a registry of the live widgets, sizers and sizer cells,
+# allowing them to be looked up by their guiId or by user-defined tags.
+
+from weakref import WeakValueDictionary, WeakKeyDictionary, WeakSet
+
+
+class Registry:
+    """
+    Keep track of the widgets, sizers and sizer cells by their guiId, as well
+    as by any tags added to them.
+
+    Only weak references are kept, so an object that is no longer used gets
+    dropped from the registry automatically; an object removed from its sizer
+    or destroyed is removed from it explicitly, together with the objects
+    within it. The tags of a removed object are remembered, so it can be found
+    by them again once it is registered anew (e.g. when added to another
+    sizer).
+
+    The registry is global: objects are registered upon creation, before they
+    can be associated with any particular GUI, so all GUI instances share it.
+
+    """
+
+    # guiIds mapped to objects
+    _objects = WeakValueDictionary()
+    # tags mapped to sets of objects
+    _tagged_objects = {}
+    # objects mapped to sets of tags
+    _object_tags = WeakKeyDictionary()
+
+    @staticmethod
+    def register(obj):
+
+        Registry._objects[obj.guiId] = obj
+
+        for tag in Registry._object_tags.get(obj, ()):
+            Registry._tagged_objects.setdefault(tag, WeakSet()).add(obj)
+
+    @staticmethod
+    def update_id(obj, old_id):
+        """
+        Register the given object under its current guiId instead of the given
+        old guiId, if it was registered under the latter; an object without an
+        old guiId (i.e. a new object) is registered in any case.
+
+        """
+
+        if old_id is None:
+            Registry.register(obj)
+        elif Registry._objects.get(old_id) is obj:
+            del Registry._objects[old_id]
+            Registry._objects[obj.guiId] = obj
+
+    @staticmethod
+    def is_registered(obj):
+
+        return Registry._objects.get(obj.guiId) is obj
+
+    @staticmethod
+    def unregister(obj, keep_tags=False):
+        """
+        Remove the given object from the registry. If `keep_tags` is True, its
+        tags are remembered for when it gets registered again.
+
+        """
+
+        if Registry._objects.get(obj.guiId) is obj:
+            del Registry._objects[obj.guiId]
+
+        if keep_tags:
+            tags = Registry._object_tags.get(obj, ())
+        else:
+            tags = Registry._object_tags.pop(obj, ())
+
+        for tag in tags:
+
+            objects = Registry._tagged_objects.get(tag)
+
+            if objects is None:
+                continue
+
+            objects.discard(obj)
+
+            if not objects:
+                del Registry._tagged_objects[tag]
+
+    @staticmethod
+    def get(gui_id):
+
+        return Registry._objects.get(gui_id)
+
+    @staticmethod
+    def add_tags(obj, *tags):
+
+        Registry._object_tags.setdefault(obj, set()).update(tags)
+
+        if not Registry.is_registered(obj):
+            return
+
+        for tag in tags:
+            Registry._tagged_objects.setdefault(tag, WeakSet()).add(obj)
+
+    @staticmethod
+    def remove_tags(obj, *tags):
+
+        obj_tags = Registry._object_tags.get(obj)
+
+        if not obj_tags:
+            return
+
+        for tag in tags:
+
+            if tag not in obj_tags:
+                continue
+
+            obj_tags.remove(tag)
+            objects = Registry._tagged_objects.get(tag)
+
+            if objects is None:
+                continue
+
+            objects.discard(obj)
+
+            if not objects:
+                del Registry._tagged_objects[tag]
+
+        if not obj_tags:
+            del Registry._object_tags[obj]
+
+    @staticmethod
+    def get_tags(obj):
+
+        return set(Registry._object_tags.get(obj, ()))
+
+    @staticmethod
+    def get_tagged(tag):
+
+        return list(Registry._tagged_objects.get(tag, ()))
@@ -1,15 +1,20 @@
 # Author: Epihaius
 # Date: 2019-09-23
-# Last revision: 2021-01-18
+# Last revision: 2026-10-19
 #
 # This module contains classes to implement a "sizer" system, the purpose of
 # which is to maintain the layout of widgets when resizing the window.
 
 from panda3d.core import *
+from .indexed_list import IndexedList
+from .layout_solver import *
+from .registry import Registry
 
 
 class SizerCell:
 
+    _count = 0
+
     def __init__(self, sizer, obj, obj_type, proportions, alignments, borders):
 
         self._sizer = sizer
@@ -28,9 +33,21 @@ class SizerCell:
         w += l + r
         h += b + t
         self._size = self._min_size = (w, h)
+        self._is_shown = True
+        # whether the layout of the object can be restored as it was before
+        # this cell was hidden (see `shown`)
+        self._is_layout_restorable = False
+        self._is_layout_restored = False
+        self._hidden_min_size = None
+        self._is_laid_out = False
+
+        self._gui_id = None
+        self.guiId = "cell_{}".format(SizerCell._count)
+        SizerCell._count += 1
 
     def destroy(self):
 
+        Registry.unregister(self)
         self._sizer = None
 
         if self._type != "size":
@@ -44,9 +61,11 @@ class SizerCell:
         self._obj_offset = (0, 0)
         self._size = self._min_size = (0, 0)
 
-    def __getitem__(key):
+    def __getitem__(self, key):
 
-        if key == "proportions":
+        if key == "guiId":
+            return self.guiId
+        elif key == "proportions":
             return self.proportions
         elif key == "alignments":
             return self.alignments
@@ -55,13 +74,83 @@ class SizerCell:
 
     def __setitem__(self, key, value):
 
-        if key == "proportions":
+        if key == "guiId":
+            self.guiId = value
+        elif key == "proportions":
             self.proportions = value
         elif key == "alignments":
             self.alignments = value
         elif key == "borders":
             self.borders = value
 
+    @property
+    def guiId(self):
+
+        return self._gui_id
+
+    @guiId.setter
+    def guiId(self, gui_id):
+
+        old_id = self._gui_id
+        self._gui_id = gui_id
+        Registry.update_id(self, old_id)
+
+    def _register(self):
+        """
+        Register this cell and the objects within it (see `Registry`), as they
+        became part of the layout by being added to a sizer.
+
+        Objects are registered when created, so the contents of the object of
+        this cell only need to be registered (again) if the object itself is
+        not registered, i.e. if it was removed from a sizer before.
+
+        """
+
+        Registry.register(self)
+
+        if self._type == "size" or Registry.is_registered(self._obj):
+            return
+
+        for obj in self.__iter_contents():
+            Registry.register(obj)
+
+    def _unregister(self):
+        """
+        Unregister this cell and the objects within it, as they are no longer
+        part of the layout after being removed from their sizer; their tags are
+        kept for when they are added to a sizer again.
+
+        """
+
+        Registry.unregister(self, keep_tags=True)
+
+        for obj in self.__iter_contents():
+            Registry.unregister(obj, keep_tags=True)
+
+    def __iter_contents(self):
+        """
+        Iterate over the object of this cell and the sizers, cells, widgets
+        within it, including those in the sizers of widgets (like
+        `Sizer.iter_widgets`).
+
+        """
+
+        if self._type == "size":
+            return
+
+        yield self._obj
+        sizer = self._obj if self._type == "sizer" else self._obj.sizer
+
+        if sizer is None:
+            return
+
+        if sizer is not self._obj:
+            yield sizer
+
+        for cell in sizer.cells:
+            yield cell
+            yield from cell.__iter_contents()
+
     @property
     def type(self):
 
@@ -85,6 +174,148 @@ class SizerCell:
 
         return self._obj
 
+    @property
+    def shown(self):
+        """
+        Whether this cell is part of the layout.
+
+        A hidden cell does not take up any space (not even a gap) and the
+        DirectGui objects it contains are stashed. Its object keeps its layout,
+        so if it is shown again with the same size and position, while nothing
+        changed within the object, it does not need to be laid out anew.
+
+        """
+
+        return self._is_shown
+
+    @shown.setter
+    def shown(self, shown):
+
+        if self._is_shown == shown:
+            return
+
+        self._is_shown = shown
+        is_object_stale = self.__is_object_stale()
+
+        if shown:
+            self._is_layout_restorable = self._is_layout_restorable and not is_object_stale
+        elif self._type != "size":
+            # a spacer has no layout of its own that could be restored
+            self._is_layout_restorable = self._is_laid_out and not is_object_stale
+            self._hidden_min_size = self._min_size
+
+        # the objects in a cell within a hidden cell need to remain stashed
+        # until that cell is shown (see `__stash`)
+        if not shown or self.__are_ancestors_shown():
+            self.__stash(not shown)
+
+        if self._sizer:
+            self._sizer._handle_cell_visibility_change(self)
+
+    def __is_object_stale(self):
+
+        if self._type == "sizer":
+            sizer = self._obj
+        elif self._type == "widget":
+            sizer = self._obj.sizer
+        else:
+            return False
+
+        return sizer.is_min_size_stale if sizer else False
+
+    def __are_ancestors_shown(self):
+        """
+        Check whether all of the cells containing the sizer of this cell,
+        directly or through other sizers, are shown.
+        A hidden cell containing a widget that owns that sizer does not need
+        to be checked, as stashing the DirectGui object of that widget also
+        hides the objects parented to it.
+
+        """
+
+        cell = self._sizer.sizer_cell if self._sizer else None
+
+        while cell:
+
+            if not cell._is_shown:
+                return False
+
+            cell = cell._sizer.sizer_cell if cell._sizer else None
+
+        return True
+
+    def __stash(self, stash):
+
+        if self._type == "widget":
+
+            dgui_obj = self._obj.dgui_obj
+
+            if dgui_obj:
+                if stash:
+                    dgui_obj.stash()
+                else:
+                    dgui_obj.unstash()
+
+        elif self._type == "sizer":
+
+            for cell in self._obj.cells:
+                if cell.shown:
+                    cell.__stash(stash)
+
+    def _update_stash(self, unstash=True):
+        """
+        Stash the DirectGui object(s) in this cell if this cell or any of the
+        cells containing it is hidden, or unstash them otherwise (unless
+        `unstash` is False).
+        Called when this cell is added to a sizer, as that sizer can be part of
+        a hidden cell or not, regardless of the sizer this cell was in before.
+
+        """
+
+        stash = not (self._is_shown and self.__are_ancestors_shown())
+
+        if stash or unstash:
+            self.__stash(stash)
+
+    def _keep_layout(self):
+        """
+        Allow the current layout of the object to be restored when this cell is
+        assigned the same size again (e.g. after being moved to another sizer).
+
+        """
+
+        # a hidden cell already keeps track of its layout (see `shown`), while
+        # a spacer has no layout to keep
+        if self._is_shown and self._type != "size":
+            self._is_layout_restorable = self._is_laid_out and not self.__is_object_stale()
+            self._hidden_min_size = self._min_size
+
+    def _reparent_objects(self, parent):
+        """
+        Reparent the DirectGui object(s) contained in this cell to the given
+        NodePath.
+
+        """
+
+        if self._type == "widget":
+            self._obj.reparent_to(parent)
+        elif self._type == "sizer":
+            for cell in self._obj.cells:
+                cell._reparent_objects(parent)
+
+    def pop_layout_restored(self):
+        """
+        Return whether the layout of the object was restored when this cell
+        got shown again, in which case it does not need to be repositioned if
+        its position did not change either.
+
+        """
+
+        is_restored = self._is_layout_restored
+        self._is_layout_restored = False
+
+        return is_restored
+
     @property
     def object_offset(self):
 
@@ -128,47 +359,76 @@ class SizerCell:
 
     def set_size(self, size):
 
-        width, height = self._size = size
-        offset = [0, 0]
+        if self._is_layout_restorable:
+
+            self._is_layout_restorable = False
+
+            if size == self._size and self._min_size == self._hidden_min_size:
+                self._is_layout_restored = True
+                return
+
+        self._size = size
+        self._is_laid_out = True
+        offset = (0, 0)
 
         if self._type != "size":
+            new_size, offset = get_cell_layout(size, self._obj.min_size,
+                self.alignments, self._borders, self._sizer.prim_dim)
+            self._obj.set_size(new_size)
 
-            size = [width, height]
-            l, r, b, t = self._borders
-            size[0] -= l + r
-            size[1] -= t + b
-            offset[0] += l
-            offset[1] += t
-            w, h = self._obj.min_size
-            new_size = [w, h]
-            prim_dim = self._sizer.prim_dim
+        self._obj_offset = offset
 
-            if self.alignments[prim_dim] == "max":
-                offset[prim_dim] += size[prim_dim] - new_size[prim_dim]
-            elif self.alignments[prim_dim] == "center":
-                offset[prim_dim] += (size[prim_dim] - new_size[prim_dim]) // 2
+    def set_layout(self, size, object_offset):
+        """
+        Set the size of this cell and the offset of its object, as computed by
+        `layout_solver.solve_layout`, without updating the object itself.
+
+        """
 
-            if self.alignments[1-prim_dim] == "max":
-                offset[1-prim_dim] += size[1-prim_dim] - new_size[1-prim_dim]
-            elif self.alignments[1-prim_dim] == "center":
-                offset[1-prim_dim] += (size[1-prim_dim] - new_size[1-prim_dim]) // 2
+        self._size = size
+        self._obj_offset = object_offset
+        self._is_laid_out = True
 
-            if self.alignments[prim_dim] == "expand":
-                new_size[prim_dim] = size[prim_dim]
-            if self.alignments[1-prim_dim] == "expand":
-                new_size[1-prim_dim] = size[1-prim_dim]
+    def iter_snapshot(self):
+        """
+        Return a generator building a snapshot of this cell (see
+        `Sizer.iter_snapshot`).
 
-            self._obj.set_size(tuple(new_size))
+        """
 
-        self._obj_offset = tuple(offset)
+        obj_size = sizer = None
+
+        if self._type == "size":
+            obj_min_size = None
+        elif self._type == "sizer":
+            obj_min_size = self._obj.min_size
+            sizer = yield from self._obj.iter_snapshot()
+        else:
+            obj_min_size = self._obj.min_size
+            obj_size = self._obj._get_frame_size()
+
+            if self._obj.sizer:
+                sizer = yield from self._obj.sizer.iter_snapshot()
+
+        return CellSnapshot(self, self._type, self._obj, self._min_size, obj_min_size,
+            obj_size, self.proportions, self.alignments, self._borders, sizer)
 
 
 class Sizer:
 
     _count = 0
     _global_default_proportions = (0., 0.)
-
-    def __init__(self, prim_dir, prim_limit=0, gaps=(0, 0)):
+    # the maximum number of primary sizes for which the line breaks of a
+    # wrapping sizer are cached
+    _max_cached_line_breaks = 16
+    # the track proportions and the track sizes computed for sizers declaring
+    # a template (see `template`), shared among all of those sizers; the track
+    # sizes are cached per template, keyed by track minimum sizes and size
+    _template_proportions = {}
+    _template_sizes = {}
+    _max_cached_template_results = 4096
+
+    def __init__(self, prim_dir, prim_limit=0, gaps=(0, 0), wrap=False):
 
         self._type = "sizer"
         self.owner = None
@@ -179,6 +439,24 @@ class Sizer:
         # max. number of cells in each row (horizontal growth) or column
         # (vertical growth)
         self.prim_limit = prim_limit
+        # if wrap is True, prim_limit is ignored and cells flow into a new row
+        # (horizontal growth) or column (vertical growth) whenever the next
+        # cell would no longer fit within the primary size of this sizer
+        self._wrap = wrap
+        # the indices of the cells starting a new line, cached per primary size
+        self._line_breaks = {}
+        # the primary size for which the current lines were computed
+        self._wrap_size = None
+        # the line breaks and secondary line sizes used to lay out the cells
+        self._laid_out_breaks = None
+        self._line_sizes = []
+        # the index of the first line whose cells need to be repositioned
+        self._reflow_line = 0
+        self._positioned_pos = None
+        self._template = None
+        # the template of this sizer together with the minimum sizes of its
+        # columns and rows, under which its track sizes are cached
+        self._template_key = None
         self._gaps = [gaps[0], gaps[1]]
         self._default_proportions = (-1., -1.)
         self._proportions = [{}, {}]
@@ -192,30 +470,47 @@ class Sizer:
         # current size, bigger than or equal to minimum size needed for current
         # contents
         self._size = (0, 0)
-        self._cells = []
-
+        # the cells are kept in an IndexedList, allowing fast insertion and
+        # removal of cells at any index as well as fast retrieval of their index
+        self._cells = IndexedList()
+        # the cells that are currently shown (see `SizerCell.shown`)
+        self._shown_cells = self._cells
+        # a flattened tuple of all widgets in this sizer (see `get_widget_index`)
+        self._widget_index = None
+        # frozen layout (see `frozen`)
+        self._is_frozen = False
+        self._is_frozen_layout_valid = False
+        self._frozen_pos = None
+
+        self._gui_id = None
         self.guiId = "sizer_{}".format(Sizer._count)
         Sizer._count += 1
 
     def destroy(self):
 
+        Registry.unregister(self)
+
         for cell in self._cells:
             cell.destroy()
 
-        self._cells = []
+        self._cells = self._shown_cells = IndexedList()
+        self._invalidate_widget_index()
         self.owner = None
         self.sizer_cell = None
 
     def clear(self, destroy_cells=False):
 
-        if destroy_cells:
-            for cell in self._cells:
+        for cell in self._cells:
+            if destroy_cells:
                 cell.destroy()
+            else:
+                cell._unregister()
 
-        self._cells = []
+        self._cells = self._shown_cells = IndexedList()
+        self._invalidate_widget_index()
         self.set_min_size_stale()
 
-    def __getitem__(key):
+    def __getitem__(self, key):
 
         if key == "guiId":
             return self.guiId
@@ -223,6 +518,8 @@ class Sizer:
             return self.prim_dir
         elif key == "prim_limit":
             return self.prim_limit
+        elif key == "wrap":
+            return self.wrap
         elif key == "gaps":
             return self.gaps
         elif key == "default_size":
@@ -236,11 +533,25 @@ class Sizer:
             self.prim_dir = value
         elif key == "prim_limit":
             self.prim_limit = value
+        elif key == "wrap":
+            self.wrap = value
         elif key == "gaps":
             self.gaps = value
         elif key == "default_size":
             self.default_size = value
 
+    @property
+    def guiId(self):
+
+        return self._gui_id
+
+    @guiId.setter
+    def guiId(self, gui_id):
+
+        old_id = self._gui_id
+        self._gui_id = gui_id
+        Registry.update_id(self, old_id)
+
     @property
     def type(self):
 
@@ -257,6 +568,18 @@ class Sizer:
         self.prim_dim = 0 if prim_dir == "horizontal" else 1
         self.set_min_size_stale()
 
+    @property
+    def wrap(self):
+
+        return self._wrap
+
+    @wrap.setter
+    def wrap(self, wrap):
+
+        if self._wrap != wrap:
+            self._wrap = wrap
+            self.set_min_size_stale()
+
     @property
     def gaps(self):
 
@@ -266,6 +589,102 @@ class Sizer:
     def gaps(self, gaps):
 
         self._gaps = [gaps[0], gaps[1]]
+        self._set_frozen_layout_stale()
+
+    @property
+    def frozen(self):
+        """
+        Whether the internal layout of this sizer is kept as is, as long as its
+        size does not change.
+
+        Once the contents of a frozen sizer have been laid out, a layout update
+        assigning the same size to it does not lay them out again; if the
+        sizer itself was not moved either, its contents are not repositioned.
+        Any change within the sizer that affects its layout (adding, removing,
+        showing or hiding cells, changes to minimum sizes, proportions or gaps)
+        discards the frozen layout, such that it gets recomputed in the next
+        layout update, after which it is kept again.
+
+        """
+
+        return self._is_frozen
+
+    @frozen.setter
+    def frozen(self, frozen):
+
+        self._is_frozen = frozen
+        self._is_frozen_layout_valid = False
+
+    def _set_frozen_layout_stale(self):
+        """
+        Discard the frozen layout (see `frozen`) of this sizer and of the
+        sizers containing it, directly or through a widget.
+
+        """
+
+        sizer = self
+
+        while sizer:
+            sizer._is_frozen_layout_valid = False
+            sizer = sizer.__get_parent_sizer()
+
+    @property
+    def template(self):
+        """
+        The identity (any hashable object) of the template this sizer is an
+        instance of, or None.
+
+        Sizers declaring the same template are assumed to be structurally
+        identical: they have the same primary direction, primary limit, gaps,
+        default size, number of cells, as well as the same proportions, both
+        associated with their cells and explicitly set, and the same default
+        proportions. Only the minimum sizes of their cells (e.g. due to different
+        texts) may differ.
+        The proportions of their rows and columns are then computed only once,
+        while the sizes of their rows and columns are computed only once for
+        each combination of row and column minimum sizes and sizer size; these
+        results are reused by all of those sizers.
+        Changing the explicit or default proportions of any of those sizers
+        discards the results cached for their template, so they are expected
+        to be changed for all of them alike. If the proportions associated with
+        their cells are changed afterwards, `clear_template_cache` needs to be
+        called.
+
+        """
+
+        return self._template
+
+    @template.setter
+    def template(self, template):
+
+        self._template = template
+        self._template_key = None
+        self.set_min_size_stale()
+
+    @staticmethod
+    def clear_template_cache():
+
+        Sizer._template_proportions.clear()
+        Sizer._template_sizes.clear()
+
+    def __clear_template_results(self):
+        """
+        Discard the results cached for the template of this sizer (if any), as
+        they are no longer valid after a change to its proportions.
+
+        """
+
+        if self._template is not None:
+            Sizer._template_proportions.pop(self._template, None)
+            Sizer._template_sizes.pop(self._template, None)
+
+    @staticmethod
+    def __cache_template_result(cache, key, result):
+
+        if len(cache) >= Sizer._max_cached_template_results:
+            del cache[next(iter(cache))]
+
+        cache[key] = result
 
     @property
     def owner_widget(self):
@@ -284,12 +703,19 @@ class Sizer:
 
         obj_type = "size" if type(obj) == tuple else obj.type
         cell = SizerCell(self, obj, obj_type, proportions, alignments, borders)
+        cell._register()
+
+        # the objects of a new cell only need to be stashed if it is added to
+        # a hidden part of the layout
+        if obj_type != "size":
+            cell._update_stash(unstash=False)
 
         if index is None:
             self._cells.append(cell)
         else:
             self._cells.insert(index, cell)
 
+        self._invalidate_widget_index()
         self.set_min_size_stale()
 
         if obj_type == "sizer":
@@ -303,12 +729,15 @@ class Sizer:
     def add_cell(self, cell, index=None):
 
         cell.sizer = self
+        cell._register()
+        cell._update_stash()
 
         if index is None:
             self._cells.append(cell)
         else:
             self._cells.insert(index, cell)
 
+        self._invalidate_widget_index()
         self.set_min_size_stale()
 
     def remove_cell(self, cell, destroy=False):
@@ -318,37 +747,279 @@ class Sizer:
 
         if destroy:
             cell.destroy()
+        else:
+            cell._unregister()
 
+        self._invalidate_widget_index()
         self.set_min_size_stale()
 
+    def remove_cells(self, cells, destroy=False):
+        """
+        Remove all of the given cells in one go, such that the minimum size of
+        this sizer needs to be invalidated only once.
+
+        """
+
+        for cell in cells:
+
+            self._cells.remove(cell)
+            cell.sizer = None
+
+            if destroy:
+                cell.destroy()
+            else:
+                cell._unregister()
+
+        self._invalidate_widget_index()
+        self.set_min_size_stale()
+
+    def move_cell(self, cell, sizer, index=None, parent=None):
+        """
+        Move the given cell from this sizer to the given sizer, inserting it at
+        the given index, or appending it if None.
+
+        The object of the cell keeps its computed minimum size and, if the cell
+        gets the same size in the other sizer, its internal layout, such that
+        only the rows and columns of both sizers need to be recomputed.
+        The DirectGui objects in the cell are reparented to the given parent
+        NodePath or, if None and the other sizer is owned by a different widget,
+        to the NodePath that widget parents its contents to (see
+        `Widget.get_content_parent`).
+
+        """
+
+        if parent is None:
+
+            owner_widget = sizer.owner_widget
+
+            if owner_widget and owner_widget is not self.owner_widget:
+                parent = owner_widget.get_content_parent()
+
+        if parent is None:
+            cell._keep_layout()
+        else:
+            # the objects need to be repositioned relative to their new parent
+            cell._reparent_objects(parent)
+
+        self.remove_cell(cell)
+        sizer.add_cell(cell, index)
+
     @property
     def cells(self):
 
         return self._cells
 
+    def get_cell_index(self, cell):
+
+        return self._cells.index(cell)
+
+    def _handle_cell_visibility_change(self, cell):
+
+        self.set_min_size_stale()
+
+    def __get_rows(self):
+        """
+        Return the cells of this sizer, grouped into rows (if its primary
+        direction is horizontal) or columns.
+
+        """
+
+        cells = self._shown_cells
+        count = len(cells)
+        prim_limit = self.prim_limit if self.prim_limit else count
+
+        return [cells[i:i+prim_limit] for i in range(0, count, max(1, prim_limit))]
+
+    def __get_line_breaks(self, prim_size):
+        """
+        Return the indices of the cells starting a new line when wrapping them
+        within the given primary size (None meaning unlimited size).
+
+        The line breaks are computed in a single pass over the cells, by
+        starting a new line whenever the next cell does not fit on the current
+        one, and they are cached until the minimum sizes of the cells change.
+
+        """
+
+        breaks = self._line_breaks.get(prim_size)
+
+        if breaks is not None:
+            return breaks
+
+        prim_dim = self.prim_dim
+        gap = self._gaps[prim_dim]
+        breaks = []
+        line_size = 0
+
+        for i, cell in enumerate(self._shown_cells):
+
+            cell_size = cell.min_size[prim_dim]
+
+            if not breaks or (prim_size is not None
+                    and line_size + gap + cell_size > prim_size):
+                breaks.append(i)
+                line_size = cell_size
+            else:
+                line_size += gap + cell_size
+
+        breaks = tuple(breaks)
+        cached_breaks = self._line_breaks
+
+        if len(cached_breaks) >= self._max_cached_line_breaks:
+            del cached_breaks[next(iter(cached_breaks))]
+
+        cached_breaks[prim_size] = breaks
+
+        return breaks
+
+    def __get_lines(self, breaks, start=0):
+        """
+        Return the cells of this wrapping sizer, grouped into the lines defined
+        by the given line breaks, starting at the line with the given index.
+
+        """
+
+        cells = self._shown_cells
+        ends = breaks[1:] + (len(cells),)
+
+        return [cells[i:j] for i, j in zip(breaks[start:], ends[start:])]
+
+    def __get_wrapped_sec_min_size(self, breaks):
+
+        sec_dim = 1 - self.prim_dim
+        sec_min_size = sum(max(cell.min_size[sec_dim] for cell in line)
+            for line in self.__get_lines(breaks))
+        sec_min_size += self._gaps[sec_dim] * max(0, len(breaks) - 1)
+
+        return max(self._default_size[sec_dim], sec_min_size)
+
+    def __update_wrapped_min_size(self):
+        """
+        Update the minimum size of this wrapping sizer. Its primary minimum
+        size is that of its largest cell, while its secondary minimum size is
+        the one needed for the lines obtained at its current primary size.
+
+        """
+
+        # the line breaks need to be recomputed, as the minimum sizes of the
+        # cells may have changed
+        self._line_breaks = {}
+        self._laid_out_breaks = None
+        prim_dim = self.prim_dim
+        prim_min_size = max((cell.min_size[prim_dim] for cell in self._shown_cells),
+            default=0)
+        min_size = [0, 0]
+        min_size[prim_dim] = max(self._default_size[prim_dim], prim_min_size)
+        breaks = self.__get_line_breaks(self._wrap_size)
+        min_size[1-prim_dim] = self.__get_wrapped_sec_min_size(breaks)
+
+        return tuple(min_size)
+
     def get_widgets(self, include_children=True):
 
-        widgets = []
+        return list(self.iter_widgets(include_children))
+
+    def iter_widgets(self, include_children=True, widget_type=None, shown_only=False):
+        """
+        Iterate over the widgets in this sizer and its subsizers, depth-first.
+
+        If `include_children` is True, the widgets in the sizers of those
+        widgets are included as well.
+        If `widget_type` is given (a class or tuple of classes), only widgets of
+        that type are yielded.
+        If `shown_only` is True, widgets in hidden cells (see `SizerCell.shown`)
+        are skipped, together with any widgets they contain.
+        Without the latter two filters, the widgets are taken from the cached
+        index returned by `get_widget_index`.
+
+        """
+
+        if include_children and not shown_only:
+            widgets = self.get_widget_index()
+        else:
+            widgets = self.__iter_widgets(include_children, shown_only)
+
+        if widget_type is None:
+            yield from widgets
+        else:
+            for widget in widgets:
+                if isinstance(widget, widget_type):
+                    yield widget
+
+    def __iter_widgets(self, include_children, shown_only):
 
         for cell in self._cells:
 
+            if shown_only and not cell.shown:
+                continue
+
             if cell.type == "widget":
 
                 widget = cell.object
-                widgets.append(widget)
+                yield widget
 
-                if include_children:
+                if include_children and widget.sizer:
+                    yield from widget.sizer.__iter_widgets(True, shown_only)
 
-                    sizer = widget.sizer
+            elif cell.type == "sizer":
 
-                    if sizer:
-                        widgets.extend(sizer.get_widgets())
+                yield from cell.object.__iter_widgets(include_children, shown_only)
 
-            elif cell.type == "sizer":
+    def get_widget_index(self):
+        """
+        Return a tuple of all widgets in this sizer, its subsizers and the sizers
+        of those widgets, in depth-first order.
+
+        The tuple is cached until a cell gets added to or removed from any of
+        those sizers, or any of those widgets gets a new sizer.
+
+        """
 
-                widgets.extend(cell.object.get_widgets(include_children))
+        if self._widget_index is None:
 
-        return widgets
+            widgets = []
+
+            # the indices of subsizers are built (and cached) as well, so a
+            # sizer with a cached index only has subsizers with cached indices
+            for cell in self._cells:
+
+                if cell.type == "widget":
+
+                    widget = cell.object
+                    widgets.append(widget)
+
+                    if widget.sizer:
+                        widgets.extend(widget.sizer.get_widget_index())
+
+                elif cell.type == "sizer":
+
+                    widgets.extend(cell.object.get_widget_index())
+
+            self._widget_index = tuple(widgets)
+
+        return self._widget_index
+
+    def _invalidate_widget_index(self):
+        """
+        Clear the cached widget index of this sizer and of the sizers containing
+        it, directly or through a widget.
+
+        """
+
+        sizer = self
+
+        # if the index of a sizer is not cached, neither are the indices of the
+        # sizers containing it
+        while sizer and sizer._widget_index is not None:
+
+            sizer._widget_index = None
+            owner = sizer.owner
+
+            if owner and owner.type == "widget":
+                cell = owner.sizer_cell
+                sizer = cell.sizer if cell else None
+            else:
+                sizer = owner
 
     @property
     def default_size(self):
@@ -369,6 +1040,11 @@ class Sizer:
 
         self.set_min_size_stale()
 
+    @property
+    def is_min_size_stale(self):
+
+        return self._is_min_size_stale
+
     def set_min_size_stale(self, stale=True):
 
         if self._is_min_size_stale == stale:
@@ -376,7 +1052,13 @@ class Sizer:
 
         self._is_min_size_stale = stale
 
-        if stale and self.owner:
+        if stale:
+            self._is_frozen_layout_valid = False
+            self.__set_owner_min_size_stale()
+
+    def __set_owner_min_size_stale(self):
+
+        if self.owner:
 
             if self.owner.type == "sizer":
 
@@ -409,56 +1091,50 @@ class Sizer:
         self._min_size = size
         self._is_min_size_stale = False
 
-    def __get_col_row_min_sizes(self):
-
-        prim_dim = self.prim_dim
-        prim_limit = len(self._cells) if self.prim_limit == 0 else self.prim_limit
-        min_sizes = [None, None]
-        min_sizes[prim_dim] = prim_min_sizes = [0] * len(self._cells[:prim_limit])
-        min_sizes[1-prim_dim] = sec_min_sizes = []
-        cells = self._cells[:]
-
-        while cells:
-
-            sec_min_size = 0
-
-            for i, cell in enumerate(cells[:prim_limit]):
-                min_size = cell.min_size
-                prim_min_sizes[i] = max(prim_min_sizes[i], min_size[prim_dim])
-                sec_min_size = max(sec_min_size, min_size[1-prim_dim])
-
-            sec_min_sizes.append(sec_min_size)
-            del cells[:prim_limit]
-
-        return min_sizes
-
     def update_min_size(self):
 
         if not self._is_min_size_stale:
             return self._min_size
 
-        for cell in self._cells:
+        cells = self._cells
+
+        if all(cell.shown for cell in cells):
+            self._shown_cells = cells
+        else:
+            self._shown_cells = cells = [cell for cell in cells if cell.shown]
 
+        for cell in cells:
             if cell.type == "widget":
+                cell.object.update_min_size()
 
-                sizer = cell.object.sizer
+        for cell in cells:
+            cell.update_min_size()
 
-                if sizer:
-                    sizer.update_min_size()
+        if self._wrap:
+            self._min_size = width, height = self.__update_wrapped_min_size()
+            self._is_min_size_stale = False
+            w, h = self._size
+            self._size = (max(width, w), max(height, h))
+            return self._min_size
 
-        for cell in self._cells:
-            cell.update_min_size()
+        rows = self.__get_rows()
+        min_sizes = get_track_min_sizes(rows, self.prim_dim)
+
+        # the results computed for a template cannot be reused while any of the
+        # cells are hidden
+        if self._template is None or cells is not self._cells:
+            self._template_key = None
+        else:
+            self._template_key = (self._template, tuple(map(tuple, min_sizes)))
 
-        min_sizes = self.__get_col_row_min_sizes()
         min_w = sum(min_sizes[0])
         min_h = sum(min_sizes[1])
         prim_dim = self.prim_dim
-        prim_limit = len(self._cells) if self.prim_limit == 0 else self.prim_limit
         w_d, h_d = self._default_size
         min_size = [max(w_d, min_w), max(h_d, min_h)]
         gap_counts = [0, 0]
-        gap_counts[prim_dim] = max(0, len(self._cells[:prim_limit]) - 1)
-        gap_counts[1-prim_dim] = max(0, (len(self._cells) - 1) // max(1, prim_limit))
+        gap_counts[prim_dim] = max(0, len(rows[0]) - 1) if rows else 0
+        gap_counts[1-prim_dim] = max(0, len(rows) - 1)
         min_size[prim_dim] += self._gaps[prim_dim] * gap_counts[prim_dim]
         min_size[1-prim_dim] += self._gaps[1-prim_dim] * gap_counts[1-prim_dim]
         self._min_size = width, height = tuple(min_size)
@@ -468,6 +1144,36 @@ class Sizer:
 
         return self._min_size
 
+    def iter_update_min_size(self):
+        """
+        Return a generator updating the minimum size of this sizer, like
+        `update_min_size`.
+
+        The stale minimum sizes of the subsizers and of the sizers of widgets
+        are updated first, yielding after each cell, such that the update can
+        be spread over multiple frames (see `GUI.layout_async`); the minimum
+        size of each sizer is then computed from those of its cells in one go.
+        The generator returns the minimum size as the value of its
+        StopIteration.
+
+        """
+
+        if self._is_min_size_stale:
+
+            for cell in self._cells:
+
+                if not cell.shown:
+                    continue
+
+                if cell.type == "sizer":
+                    yield from cell.object.iter_update_min_size()
+                elif cell.type == "widget" and cell.object.sizer:
+                    yield from cell.object.sizer.iter_update_min_size()
+
+                yield
+
+        return self.update_min_size()
+
     @staticmethod
     def get_global_default_proportions():
 
@@ -484,6 +1190,9 @@ class Sizer:
 
         Sizer._global_default_proportions = (max(0., column_proportion),
                                              max(0., row_proportion))
+        # the cached proportions and track sizes may depend on the old default
+        # proportions
+        Sizer.clear_template_cache()
 
     def get_default_proportions(self):
 
@@ -498,47 +1207,19 @@ class Sizer:
         """
 
         self._default_proportions = (column_proportion, row_proportion)
+        self.__clear_template_results()
+        self._set_frozen_layout_stale()
 
-    def __get_cell_proportions(self):
+    def __get_default_proportions(self):
         """
-        Return the largest horizontal and vertical proportions associated with
-        the cells in this sizer.
-
-        Each time an object was added to this sizer, proportions were associated
-        with the object's cell. The largest of the horizontal proportions will
-        be considered for the cell's column, while the largest of the vertical
-        proportions will be considered for the cell's row.
-        They will be applied only in the absence of an explicitly set proportion.
+        Return the proportions applied to the columns and rows of this sizer
+        when neither an explicitly set proportion nor a proportion associated
+        with any of their cells is available.
 
         """
 
-        prim_dim = self.prim_dim
-        prim_limit = len(self._cells) if self.prim_limit == 0 else self.prim_limit
-        proportions = [None, None]
-        proportions[prim_dim] = prim_proportions = [-1.] * len(self._cells[:prim_limit])
-        proportions[1-prim_dim] = sec_proportions = []
-        cells = self._cells[:]
-
-        while cells:
-
-            sec_proportion = -1.
-
-            for i, cell in enumerate(cells[:prim_limit]):
-                min_size = cell.update_min_size()
-                prim_proportions[i] = max(prim_proportions[i], cell.proportions[prim_dim])
-                sec_proportion = max(sec_proportion, cell.proportions[1-prim_dim])
-
-            sec_proportions.append(sec_proportion)
-            del cells[:prim_limit]
-
-        default_proportions = [p1 if p2 < 0. else p2 for p1, p2 in
-            zip(self._global_default_proportions, self._default_proportions)]
-        default_prim_p = default_proportions[prim_dim]
-        default_sec_p = default_proportions[1-prim_dim]
-        prim_proportions[:] = [default_prim_p if p < 0. else p for p in prim_proportions]
-        sec_proportions[:] = [default_sec_p if p < 0. else p for p in sec_proportions]
-
-        return proportions
+        return tuple(p1 if p2 < 0. else p2 for p1, p2 in
+            zip(self._global_default_proportions, self._default_proportions))
 
     def has_row_proportion(self, index):
         """
@@ -571,6 +1252,8 @@ class Sizer:
         if not (self.has_row_proportion(index)
                 and proportion == self.get_row_proportion(index)):
             self._proportions[1][index] = proportion
+            self.__clear_template_results()
+            self._set_frozen_layout_stale()
 
     def clear_row_proportion(self, index):
         """
@@ -583,6 +1266,8 @@ class Sizer:
 
         if index in self._proportions[1]:
             del self._proportions[1][index]
+            self.__clear_template_results()
+            self._set_frozen_layout_stale()
 
     def clear_row_proportions(self):
         """
@@ -593,6 +1278,8 @@ class Sizer:
         """
 
         self._proportions[1].clear()
+        self.__clear_template_results()
+        self._set_frozen_layout_stale()
 
     def has_column_proportion(self, index):
         """
@@ -625,6 +1312,8 @@ class Sizer:
         if not (self.has_column_proportion(index)
                 and proportion == self.get_column_proportion(index)):
             self._proportions[0][index] = proportion
+            self.__clear_template_results()
+            self._set_frozen_layout_stale()
 
     def clear_column_proportion(self, index):
         """
@@ -637,6 +1326,8 @@ class Sizer:
 
         if index in self._proportions[0]:
             del self._proportions[0][index]
+            self.__clear_template_results()
+            self._set_frozen_layout_stale()
 
     def clear_column_proportions(self):
         """
@@ -647,6 +1338,8 @@ class Sizer:
         """
 
         self._proportions[0].clear()
+        self.__clear_template_results()
+        self._set_frozen_layout_stale()
 
     def clear_proportions(self):
         """
@@ -657,33 +1350,8 @@ class Sizer:
         """
 
         self._proportions = [{}, {}]
-
-    def __apply_proportions(self, proportions, min_sizes, sizes, total_size, indices=None):
-
-        indices_to_check = list(range(len(sizes))) if indices is None else indices
-        p_sum = sum(p for i, p in enumerate(proportions) if i in indices_to_check)
-        tmp_size = total_size
-
-        for i in indices_to_check:
-
-            proportion = proportions[i]
-            min_size = min_sizes[i]
-
-            if p_sum == 0.:
-                p_sum = 1.
-
-            new_size = int(round(tmp_size * min(1., proportion / p_sum)))
-
-            if new_size < min_size:
-                total_size -= min_size
-                sizes[i] = min_size
-                indices_to_check.remove(i)
-                self.__apply_proportions(proportions, min_sizes, sizes, total_size, indices_to_check)
-                break
-
-            sizes[i] = new_size
-            tmp_size -= new_size
-            p_sum -= proportion
+        self.__clear_template_results()
+        self._set_frozen_layout_stale()
 
     def get_size(self):
 
@@ -693,51 +1361,150 @@ class Sizer:
 
         if force:
             self._size = size
+            # the contents got laid out by other means
+            self._is_frozen_layout_valid = False
             return
 
         width, height = size
         w_min, h_min = self.min_size
-        self._size = (max(w_min, width), max(h_min, height))
+        new_size = (max(w_min, width), max(h_min, height))
 
-        if not self._cells:
+        if self._is_frozen_layout_valid and new_size == self._size:
+            return
+
+        self._size = new_size
+
+        if self._is_frozen:
+            self._is_frozen_layout_valid = not self._is_min_size_stale
+            # the contents need to be repositioned
+            self._frozen_pos = None
+
+        if not self._shown_cells:
+            return
+
+        if self._wrap:
+            self.__set_wrapped_size()
             return
 
         prim_dim = self.prim_dim
-        prim_limit = len(self._cells) if self.prim_limit == 0 else self.prim_limit
-        size = list(self._size)
-
-        counts = [0, 0]
-        counts[prim_dim] = len(self._cells[:prim_limit])
-        counts[1-prim_dim] = (len(self._cells) - 1) // prim_limit + 1
-        size[prim_dim] -= self._gaps[prim_dim] * max(0, counts[prim_dim] - 1)
-        size[1-prim_dim] -= self._gaps[1-prim_dim] * max(0, counts[1-prim_dim] - 1)
-        dim_sizes = [None, None]
-        dim_sizes[prim_dim] = prim_sizes = [0] * counts[prim_dim]
-        dim_sizes[1-prim_dim] = sec_sizes = [0] * counts[1-prim_dim]
-        min_sizes_by_dim = self.__get_col_row_min_sizes()
-        proportions_by_dim = self.__get_cell_proportions()
-
-        for dim, sizes in ((prim_dim, prim_sizes), (1-prim_dim, sec_sizes)):
-            min_sizes = min_sizes_by_dim[dim]
-            cell_proportions = proportions_by_dim[dim]
-            proportions = [self._proportions[dim].get(i, cell_proportions[i])
-                for i in range(counts[dim])]
-            self.__apply_proportions(proportions, min_sizes, sizes, size[dim])
-
-        cells = self._cells[:]
-        sec_index = 0
+        rows = self.__get_rows()
+
+        if self._template_key is None:
+            dim_sizes = self.__get_col_row_sizes(rows)
+        else:
+
+            template, min_sizes = self._template_key
+            cached_sizes = self._template_sizes.setdefault(template, {})
+            key = (min_sizes, self._size)
+            dim_sizes = cached_sizes.get(key)
+
+            if dim_sizes is None:
+                dim_sizes = self.__get_col_row_sizes(rows)
+                self.__cache_template_result(cached_sizes, key, dim_sizes)
+
+        prim_sizes = dim_sizes[prim_dim]
+        sec_sizes = dim_sizes[1-prim_dim]
         cell_size = [0, 0]
 
-        while cells:
+        for row, sec_size in zip(rows, sec_sizes):
 
-            cell_size[1-prim_dim] = sec_sizes[sec_index]
+            cell_size[1-prim_dim] = sec_size
 
-            for cell, prim_size in zip(cells[:prim_limit], prim_sizes):
+            for cell, prim_size in zip(row, prim_sizes):
                 cell_size[prim_dim] = prim_size
                 cell.set_size(tuple(cell_size))
 
-            sec_index += 1
-            del cells[:prim_limit]
+    def __get_col_row_sizes(self, rows):
+        """
+        Distribute the current size of this sizer over its columns and rows.
+
+        """
+
+        prim_dim = self.prim_dim
+
+        if self._template_key is None:
+            template = None
+            min_sizes_by_dim = get_track_min_sizes(rows, prim_dim)
+        else:
+            template, min_sizes_by_dim = self._template_key
+
+        proportions_by_dim = self._template_proportions.get(template)
+
+        if template is None or proportions_by_dim is None:
+
+            proportions_by_dim = get_track_proportions(rows, prim_dim,
+                self._proportions, self.__get_default_proportions())
+
+            if template is not None:
+                self._template_proportions[template] = proportions_by_dim
+
+        return get_track_sizes(self._size, self._gaps, prim_dim, min_sizes_by_dim,
+            proportions_by_dim)
+
+    def __set_wrapped_size(self):
+        """
+        Break the cells of this wrapping sizer into lines fitting its primary
+        size and set the size of each cell to its primary minimum size and the
+        secondary size of its line.
+
+        When reflowing the cells after a change of primary size, only the lines
+        from the first changed line break onward are updated.
+
+        """
+
+        prim_dim = self.prim_dim
+        sec_dim = 1 - prim_dim
+        prim_size = self._size[prim_dim]
+        breaks = self.__get_line_breaks(prim_size)
+        old_breaks = self._laid_out_breaks
+        start = 0
+
+        if prim_size != self._wrap_size:
+
+            self._wrap_size = prim_size
+            min_size = list(self._min_size)
+            min_size[sec_dim] = self.__get_wrapped_sec_min_size(breaks)
+            min_size = tuple(min_size)
+
+            if min_size != self._min_size:
+                # the sizers containing this one need to make room for the
+                # new lines in a next layout pass; invalidating their minimum
+                # sizes signals the need for that pass up to the root sizer
+                # (see `update` and `relayout`)
+                self._min_size = width, height = min_size
+                w, h = self._size
+                self._size = (max(width, w), max(height, h))
+                self.__set_owner_min_size_stale()
+
+            if old_breaks is not None:
+
+                # find the first line whose start or end changed
+                start = len(breaks)
+
+                for i, (old_break, new_break) in enumerate(zip(old_breaks, breaks)):
+                    if old_break != new_break:
+                        start = i - 1
+                        break
+                else:
+                    if len(old_breaks) != len(breaks):
+                        start = min(len(old_breaks), len(breaks)) - 1
+
+        line_sizes = self._line_sizes[:start]
+        cell_size = [0, 0]
+
+        for line in self.__get_lines(breaks, start):
+
+            line_size = max(cell.min_size[sec_dim] for cell in line)
+            line_sizes.append(line_size)
+            cell_size[sec_dim] = line_size
+
+            for cell in line:
+                cell_size[prim_dim] = cell.min_size[prim_dim]
+                cell.set_size(tuple(cell_size))
+
+        self._laid_out_breaks = breaks
+        self._line_sizes = line_sizes
+        self._reflow_line = min(self._reflow_line, start)
 
     def get_pos(self):
 
@@ -751,43 +1518,123 @@ class Sizer:
 
     def update_positions(self):
 
+        if self._is_frozen:
+
+            if self._is_frozen_layout_valid and self._pos == self._frozen_pos:
+                return
+
+            self._frozen_pos = self._pos
+
         prim_dim = self.prim_dim
-        prim_limit = len(self._cells) if self.prim_limit == 0 else self.prim_limit
         start_pos = list(self._pos)
         start_coord = start_pos[prim_dim]
-
-        cells = self._cells[:]
         gaps = self._gaps
 
-        while cells:
+        if self._wrap and self._laid_out_breaks is not None:
+
+            breaks = self._laid_out_breaks
+
+            # only the lines affected by the latest reflow need to be updated,
+            # unless this sizer was moved
+            if self._pos == self._positioned_pos:
+                start = self._reflow_line
+            else:
+                start = 0
+
+            line_sizes = self._line_sizes
+            start_pos[1-prim_dim] += sum(line_sizes[:start]) + gaps[1-prim_dim] * start
+            rows = self.__get_lines(breaks, start)
+            self._positioned_pos = self._pos
+            self._reflow_line = len(breaks)
+
+        else:
+
+            rows = self.__get_rows()
+
+        for row in rows:
 
             start_pos[prim_dim] = start_coord
 
-            for cell in cells[:prim_limit]:
+            for cell in row:
 
                 obj = cell.object
                 size = cell.get_size()
                 offset_x, offset_y = cell.object_offset
                 pos = (start_pos[0] + offset_x, start_pos[1] + offset_y)
 
+                # the layout of an object that was restored when its cell got
+                # shown again only needs updating if it moved in the meantime
+                if cell.pop_layout_restored():
+                    rect = obj.get_rect() if cell.type == "widget" else None
+                    old_pos = rect[:2] if rect else obj.get_pos()
+                    is_pos_changed = old_pos != pos
+                else:
+                    is_pos_changed = True
+
                 if cell.type == "widget":
 
                     obj.set_pos(pos)
                     sizer = obj.sizer
 
-                    if sizer:
+                    if sizer and is_pos_changed:
                         sizer.update_positions()
 
                 elif cell.type == "sizer":
 
                     obj.set_pos(pos)
-                    obj.update_positions()
+
+                    if is_pos_changed:
+                        obj.update_positions()
 
                 start_pos[prim_dim] += size[prim_dim] + gaps[prim_dim]
 
             start_pos[1-prim_dim] += size[1-prim_dim] + gaps[1-prim_dim]
 
-            del cells[:prim_limit]
+    def get_snapshot(self):
+        """
+        Return an immutable description of this sizer and its contents, to be
+        laid out by `layout_solver.solve_layout`, possibly in another thread.
+        The minimum sizes need to be up to date (see `update_min_size`).
+
+        """
+
+        snapshotter = self.iter_snapshot()
+
+        try:
+            while True:
+                next(snapshotter)
+        except StopIteration as e:
+            return e.value
+
+    def iter_snapshot(self):
+        """
+        Return a generator building the snapshot returned by `get_snapshot`.
+
+        The generator yields after each cell it processed, allowing the snapshot
+        to be built over multiple frames (see `GUI.layout_async`), and returns
+        the snapshot as the value of its StopIteration.
+
+        """
+
+        rows = []
+
+        if not self._wrap:
+
+            for row in self.__get_rows():
+
+                row_snapshot = []
+
+                for cell in row:
+                    row_snapshot.append((yield from cell.iter_snapshot()))
+                    yield
+
+                rows.append(tuple(row_snapshot))
+
+        explicit_proportions = tuple(dict(p) for p in self._proportions)
+
+        return SizerSnapshot(self, self._wrap, self.prim_dim, tuple(rows),
+            tuple(self._gaps), self._min_size, explicit_proportions,
+            self.__get_default_proportions(), self._pos)
 
     def update(self, size=None):
 
@@ -795,4 +1642,243 @@ class Sizer:
         w_min, h_min = self.update_min_size()
         new_size = (max(w, w_min), max(h, h_min))
         self.set_size(new_size)
+
+        # if the minimum size of a wrapping sizer changed because its cells
+        # were broken into a different number of lines, or the minimum height
+        # of a widget changed because its text was rewrapped to fit its width
+        # (see `Widget.height_for_width`), the minimum size of this sizer got
+        # invalidated and a second pass is needed to make room for those lines
+        if self._is_min_size_stale:
+            w_min, h_min = self.update_min_size()
+            new_size = (max(w, w_min), max(h, h_min))
+            self.set_size(new_size)
+
         self.update_positions()
+
+    def __get_parent_sizer(self):
+        """
+        Return the sizer containing either this sizer or the widget owning it.
+
+        """
+
+        owner = self.owner
+
+        if not owner:
+            return
+
+        if owner.type == "sizer":
+            return owner
+
+        cell = owner.sizer_cell
+
+        return cell.sizer if cell else None
+
+    def relayout(self):
+        """
+        Update the layout of this sizer after a change to its contents, without
+        changing its size.
+
+        If its minimum size changed as a result, the sizer containing it (or
+        its owner widget) is updated instead, and so on, such that only the
+        smallest part of the layout affected by the change gets updated.
+        As with `update`, a second pass is made if a wrapping sizer or a
+        height-for-width widget got reflowed while doing so.
+        Return False if the minimum size of the root sizer changed, in which
+        case `GUI.layout` needs to be called, as the size of the root sizer
+        depends on both its minimum size and the window size.
+
+        """
+
+        sizer = self
+
+        for is_reflowed in (False, True):
+
+            while True:
+
+                old_min_size = sizer.min_size
+
+                if sizer.update_min_size() == old_min_size:
+                    break
+
+                parent = sizer.__get_parent_sizer()
+
+                if not parent:
+                    return False
+
+                sizer = parent
+
+            sizer.set_size(sizer.get_size())
+
+            # a reflow invalidates the minimum size of the sizer that was laid
+            # out, so the part of the layout affected by it can be updated by
+            # another pass starting from that sizer
+            if is_reflowed or not sizer._is_min_size_stale:
+                break
+
+        sizer.update_positions()
+
+        return True
+
+
+class StackedSizer(Sizer):
+    """
+    A sizer holding multiple pages (e.g. the pages of a notebook), of which
+    only the active one is shown and laid out.
+
+    Its minimum size is either that of the active page or the largest one of
+    all pages, depending on the given `min_size_policy` ("active" or "max").
+    Inactive pages are hidden (see `SizerCell.shown`), keeping their last
+    layout, so switching to a page with an unchanged size and contents does not
+    need to lay it out anew.
+
+    """
+
+    def __init__(self, min_size_policy="max", gaps=(0, 0)):
+
+        Sizer.__init__(self, "horizontal", gaps=gaps)
+
+        self._min_size_policy = min_size_policy
+        self._active_cell = None
+        # pages fill up all of the space available to this sizer by default
+        self.set_default_proportions(1., 1.)
+
+    def destroy(self):
+
+        Sizer.destroy(self)
+
+        self._active_cell = None
+
+    def clear(self, destroy_cells=False):
+
+        Sizer.clear(self, destroy_cells)
+
+        self._active_cell = None
+
+    @property
+    def min_size_policy(self):
+
+        return self._min_size_policy
+
+    @min_size_policy.setter
+    def min_size_policy(self, min_size_policy):
+
+        if self._min_size_policy != min_size_policy:
+            self._min_size_policy = min_size_policy
+            self.set_min_size_stale()
+
+    def __add_page(self, cell):
+
+        if self._active_cell:
+            cell.shown = False
+        else:
+            self._active_cell = cell
+            cell.shown = True
+
+    def add(self, obj, proportions=None, alignments=None, borders=None, index=None):
+
+        cell = Sizer.add(self, obj, proportions, alignments, borders, index)
+        self.__add_page(cell)
+
+        return cell
+
+    def add_cell(self, cell, index=None):
+
+        Sizer.add_cell(self, cell, index)
+        self.__add_page(cell)
+
+    def __handle_page_removal(self):
+
+        if self._active_cell and self._active_cell.sizer is not self:
+            self._active_cell = None
+
+            if self._cells:
+                self._active_cell = self._cells[0]
+                self._active_cell.shown = True
+
+    def remove_cell(self, cell, destroy=False):
+
+        Sizer.remove_cell(self, cell, destroy)
+        self.__handle_page_removal()
+
+    def remove_cells(self, cells, destroy=False):
+
+        Sizer.remove_cells(self, cells, destroy)
+        self.__handle_page_removal()
+
+    def _handle_cell_visibility_change(self, cell):
+
+        # switching pages does not affect the minimum size of this sizer if it
+        # is determined by the largest page
+        if self._min_size_policy == "active":
+            self.set_min_size_stale()
+        else:
+            self._set_frozen_layout_stale()
+
+    @property
+    def active_cell(self):
+
+        return self._active_cell
+
+    def get_active_page(self):
+
+        return self._cells.index(self._active_cell) if self._active_cell else None
+
+    def set_active_page(self, index):
+        """
+        Show the page with the given index and hide the previously active one.
+
+        Return True if the layout is up to date afterwards, or False if it
+        needs to be updated through a call to `GUI.layout` (see `relayout`).
+
+        """
+
+        cell = self._cells[index]
+        old_cell = self._active_cell
+
+        if cell is old_cell:
+            return True
+
+        self._active_cell = cell
+
+        if old_cell:
+            old_cell.shown = False
+
+        cell.shown = True
+
+        if self._is_min_size_stale:
+            return self.relayout()
+
+        # the minimum size did not change, so only the new page needs to be
+        # laid out; if its size did not change, its previous layout is restored
+        self._shown_cells = [cell]
+        self.set_size(self._size)
+        self.update_positions()
+
+        return True
+
+    def update_min_size(self):
+
+        if not self._is_min_size_stale:
+            return self._min_size
+
+        w_min, h_min = Sizer.update_min_size(self)
+
+        if self._min_size_policy == "max":
+
+            for cell in self._cells:
+
+                if cell.shown:
+                    continue
+
+                if cell.type == "widget":
+                    cell.object.update_min_size()
+
+                w, h = cell.update_min_size()
+                w_min = max(w_min, w)
+                h_min = max(h_min, h)
+
+            self._min_size = (w_min, h_min)
+            w, h = self._size
+            self._size = (max(w_min, w), max(h_min, h))
+
+        return self._min_size
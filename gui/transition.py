@@ -0,0 +1,179 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains a class to animate the transition of widgets from their
+# previous to their new positions after a layout update.
+
+from direct.task.TaskManagerGlobal import taskMgr
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LayoutTransition:
+    """
+    Animate widgets moving to their new positions over a number of frames.
+
+    The node positions of all widgets in flight are kept in NumPy arrays, so
+    they can be advanced together in a single vectorized step each frame,
+    after which they are applied to the DirectGui objects in a single loop.
+    Only positions are animated; new sizes are applied immediately, as
+    regenerating the frame of a DirectGui object each frame would be too costly.
+
+    """
+
+    def __init__(self):
+
+        if np is None:
+            raise ImportError("Animated layout transitions require NumPy.")
+
+        self._widgets = []
+        # the node positions the widgets are moving to
+        self._end_positions = np.zeros((0, 3))
+        # the offsets from the end positions the widgets started moving from
+        self._offsets = np.zeros((0, 3))
+        self._elapsed_frames = np.zeros(0)
+        self._frame_counts = np.zeros(0)
+        self._task = None
+
+    def destroy(self):
+
+        self.finish()
+
+    @property
+    def is_active(self):
+
+        return bool(self._widgets)
+
+    def __get_progress(self):
+
+        t = np.minimum(self._elapsed_frames / self._frame_counts, 1.)
+
+        # ease in and out
+        return t * t * (3. - 2. * t)
+
+    def __get_current_offsets(self):
+
+        return self._offsets * (1. - self.__get_progress())[:, None]
+
+    def start(self, changes, frame_count):
+        """
+        Start moving the widgets in the given (widget, old_rect, new_rect)
+        tuples (see `GUI.layout`) from their old to their new positions over
+        the given number of frames.
+        Widgets already in flight continue from their current positions.
+
+        """
+
+        indices = {widget: i for i, widget in enumerate(self._widgets)}
+        current_offsets = self.__get_current_offsets()
+        widgets = []
+        end_positions = []
+        offsets = []
+
+        for widget, old_rect, new_rect in changes:
+
+            if old_rect is None or new_rect is None or not widget.dgui_obj:
+                continue
+
+            old_x, old_y, _, _ = old_rect
+            new_x, new_y, _, _ = new_rect
+            # the new node position has already been set by the layout
+            x, y, z = widget.dgui_obj.get_pos()
+            i = indices.pop(widget, None)
+
+            if i is None:
+                offset = [old_x - new_x, 0., new_y - old_y]
+            else:
+                # continue from the position the widget currently appears at
+                old_x, _, old_z = self._end_positions[i] + current_offsets[i]
+                offset = [old_x - x, 0., old_z - z]
+
+            if offset[0] or offset[2]:
+                widgets.append(widget)
+                end_positions.append((x, y, z))
+                offsets.append(offset)
+
+        # keep the widgets in flight that were not affected by the changes
+        kept = sorted(indices.values())
+
+        self._widgets = [self._widgets[i] for i in kept] + widgets
+        self._end_positions = np.concatenate((self._end_positions[kept],
+            np.array(end_positions).reshape(-1, 3)))
+        self._offsets = np.concatenate((self._offsets[kept],
+            np.array(offsets).reshape(-1, 3)))
+        self._elapsed_frames = np.concatenate((self._elapsed_frames[kept],
+            np.zeros(len(widgets))))
+        self._frame_counts = np.concatenate((self._frame_counts[kept],
+            np.full(len(widgets), max(1, frame_count), dtype=float)))
+
+        if self._widgets:
+            self.__apply()
+
+        if self._widgets and not self._task:
+            self._task = taskMgr.add(self.__step, "gui_layout_transition")
+
+    def __apply(self):
+
+        positions = (self._end_positions + self.__get_current_offsets()).tolist()
+
+        for widget, (x, y, z) in zip(self._widgets, positions):
+            if widget.dgui_obj:
+                widget.dgui_obj.set_pos(x, y, z)
+
+    def __step(self, task):
+
+        self._elapsed_frames += 1.
+        self.__apply()
+        is_done = self._elapsed_frames >= self._frame_counts
+
+        if is_done.any():
+
+            for i in np.flatnonzero(is_done):
+                self.__set_layout_pos(self._widgets[i])
+
+            remaining = ~is_done
+            self._widgets = [w for w, r in zip(self._widgets, remaining) if r]
+            self._end_positions = self._end_positions[remaining]
+            self._offsets = self._offsets[remaining]
+            self._elapsed_frames = self._elapsed_frames[remaining]
+            self._frame_counts = self._frame_counts[remaining]
+
+        if self._widgets:
+            return task.cont
+
+        self._task = None
+
+        return task.done
+
+    @staticmethod
+    def __set_layout_pos(widget):
+
+        # make sure the widget ends up at the position set by the layout, even
+        # if that changed during the transition
+        rect = widget.get_rect()
+
+        if widget.dgui_obj and rect:
+            x, y, _, _ = rect
+            widget.set_pos((x, y))
+
+    def finish(self):
+        """
+        Immediately move all widgets in flight to their new positions.
+
+        """
+
+        if self._task:
+            taskMgr.remove(self._task)
+            self._task = None
+
+        for widget in self._widgets:
+            self.__set_layout_pos(widget)
+
+        self._widgets = []
+        self._end_positions = np.zeros((0, 3))
+        self._offsets = np.zeros((0, 3))
+        self._elapsed_frames = np.zeros(0)
+        self._frame_counts = np.zeros(0)
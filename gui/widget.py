@@ -1,18 +1,52 @@
 # Author: Epihaius
 # Date: 2019-09-23
-# Last revision: 2020-10-08
+# Last revision: 2026-10-19
 #
 # This module contains wrapper classes for the DirectGui widgets.
 
 from panda3d.core import *
 from direct.gui.DirectGui import *
+from direct.showbase import ShowBaseGlobal
+from direct.task.TaskManagerGlobal import taskMgr
 from .sizer import Sizer
+from .indexed_list import IndexedList
+from .max_tracker import MaxTracker
+from .registry import Registry
+from collections import namedtuple
 from math import ceil
 
 
+# the properties of a DirectGui object needed to resize and position it (see
+# `Widget.update_style`):
+# - `scale`: the horizontal and vertical scale of the object;
+# - `border_size`: the width and height of its border (zero without a relief
+#   or with a flat one);
+# - `text_align`: the alignment of its text, or None if it has no text;
+# - `text_right`: the right edge of the tight bounds of its text, if that text
+#   is aligned to the right;
+# - `indicator_offsets`: the space taken up by its indicator (if any) at the
+#   left and right sides of its text;
+# - `has_indicator`: whether it has an indicator;
+# - `popup_marker`: its popup marker (if any), together with the horizontal
+#   offset of that marker from the right side of the frame and its vertical
+#   position.
+WidgetStyle = namedtuple("WidgetStyle", ("scale", "border_size", "text_align",
+    "text_right", "indicator_offsets", "has_indicator", "popup_marker"))
+
+
 class Widget:
 
     _count = 0
+    # the widgets whose position or size changed since the last call to
+    # `pop_rect_changes`, mapped to their rectangle before the first change
+    _rect_changes = {}
+    # the heights of wrapped texts (see `height_for_width`), keyed by text,
+    # text style and wrap width
+    _wrapped_text_heights = {}
+    _max_cached_text_heights = 4096
+    # the wrap widths of texts are rounded down to a multiple of this value (in
+    # text units), such that similar widths share the same cached height
+    _wrap_width_step = .25
 
     def __init__(self, dgui_obj):
 
@@ -21,14 +55,23 @@ class Widget:
         self._sizer = None
         # the SizerCell this widget is inside of
         self.sizer_cell = None
-
-        l, r, b, t = self._bounds = self._get_bounds(dgui_obj)
-
-        sx, _, sz = dgui_obj.get_scale()
-        w = int((r - l) * sx)
-        h = int((t - b) * sz)
-        self._size = self._min_size = (w, h)
-
+        # the size last applied to the frame of the DirectGui object, or None
+        # if the frame needs to be resized in any case (see `set_frame_size`)
+        self._frame_size = None
+
+        self._size = self._min_size = self._measure()
+        # the size reserved for this widget (see `reserve_size`)
+        self._reserved_size = None
+        self._is_reserved_size_fixed = True
+        self._pos = None
+        # the metrics needed to rewrap the text of this widget to fit the width
+        # assigned to it (see `height_for_width`)
+        self._text_wrap = None
+        self._wrap_width = None
+        # the WidgetPool this widget was created by, if any
+        self._pool = None
+
+        self._gui_id = None
         self.guiId = "widget_{}".format(Widget._count)
         Widget._count += 1
 
@@ -47,8 +90,13 @@ class Widget:
         self.sizer_cell = None
         self.dgui_obj.destroy()
         self.dgui_obj = None
+        Widget._rect_changes.pop(self, None)
+        Registry.unregister(self)
 
-    def __getitem__(key):
+        if self._pool:
+            self._pool._forget(self)
+
+    def __getitem__(self, key):
 
         if key == "guiId":
             return self.guiId
@@ -58,6 +106,18 @@ class Widget:
         if key == "guiId":
             self.guiId = value
 
+    @property
+    def guiId(self):
+
+        return self._gui_id
+
+    @guiId.setter
+    def guiId(self, gui_id):
+
+        old_id = self._gui_id
+        self._gui_id = gui_id
+        Registry.update_id(self, old_id)
+
     @property
     def type(self):
 
@@ -74,6 +134,20 @@ class Widget:
 
         return (l, r, b, t)
 
+    def _measure(self):
+        """
+        Compute the bounds of the DirectGui object and return its size.
+
+        """
+
+        self.update_style()
+        l, r, b, t = self._bounds = self._get_bounds(self.dgui_obj)
+        sx, sz = self._style.scale
+        w = int((r - l) * sx)
+        h = int((t - b) * sz)
+
+        return (w, h)
+
     def get_pos(self):
 
         x, _, z = self.dgui_obj.get_pos()
@@ -81,13 +155,134 @@ class Widget:
 
         return (int(x), int(y))
 
+    def get_content_parent(self):
+        """
+        Return the NodePath that the DirectGui objects of the widgets in the
+        sizer of this widget are parented to.
+
+        """
+
+        return self.dgui_obj
+
+    def reparent_to(self, parent):
+
+        if self.dgui_obj.is_stashed():
+            self.dgui_obj.stash_to(parent)
+        else:
+            self.dgui_obj.reparent_to(parent)
+
     def set_pos(self, pos):
 
+        if pos != self._pos:
+            self._record_rect_change()
+
+        self._pos = pos
         x, z = pos
-        sx, _, sz = self.dgui_obj.get_scale()
+        sx, sz = self._style.scale
         l, r, b, t = self._bounds
         self.dgui_obj.set_pos(x - l * sx, 0., -z - t * sz)
 
+    def update_style(self):
+        """
+        Store those properties of the DirectGui object that are needed to resize
+        and position it (see `WidgetStyle`), so they do not need to be looked up
+        anew whenever the layout is updated.
+
+        This is done automatically when the object is measured (see
+        `reset_frame_size`), but needs to be done explicitly when changing
+        options like "scale", "relief" or "borderWidth" without changing the
+        size of the object.
+
+        """
+
+        dgui_obj = self.dgui_obj
+        sx, _, sz = dgui_obj.get_scale()
+
+        if dgui_obj["relief"] not in (None, DGG.FLAT):
+            border_size = tuple(dgui_obj["borderWidth"])
+        else:
+            border_size = (0, 0)
+
+        has_indicator = dgui_obj.hascomponent("indicator")
+        text_align = text_right = None
+        l_offset = r_offset = 0
+
+        if dgui_obj.hascomponent("text0"):
+
+            text_node = dgui_obj.component("text0")
+            text_align = text_node.align
+
+            if has_indicator:
+
+                l_b, r_b, b_b, t_b = dgui_obj.indicator.guiItem.getFrame()
+                offset = r_b - l_b
+
+                if dgui_obj["boxPlacement"] == "left":
+                    l_offset = offset
+                else:
+                    r_offset = offset
+
+            if text_align == TextNode.A_right:
+                text_np = NodePath(text_node)
+                _, p = text_np.get_tight_bounds()
+                text_right = p[0]
+
+        if dgui_obj.hascomponent("popupMarker"):
+            marker = dgui_obj.component("popupMarker")
+            marker_offset = marker.getWidth() * .5 * marker.get_scale()[0]
+            marker_offset += dgui_obj["popupMarkerBorder"][0]
+            popup_marker = (marker, marker_offset, marker.get_pos()[2])
+        else:
+            popup_marker = None
+
+        self._style = WidgetStyle((sx, sz), border_size, text_align, text_right,
+            (l_offset, r_offset), has_indicator, popup_marker)
+        # the frame needs to be resized in accordance with the new style
+        self._frame_size = None
+
+    def get_rect(self):
+        """
+        Return the position (as last set by its sizer) and size of this widget
+        as an (x, y, width, height) tuple, or None if it was never positioned.
+
+        """
+
+        if self._pos is None:
+            return
+
+        x, y = self._pos
+        w, h = self.get_size()
+
+        return (x, y, w, h)
+
+    def _record_rect_change(self):
+
+        if self not in Widget._rect_changes:
+            Widget._rect_changes[self] = self.get_rect()
+
+    @staticmethod
+    def pop_rect_changes():
+        """
+        Return a list of (widget, old_rect, new_rect) tuples for the widgets
+        whose position and/or size changed since the previous call, and start
+        recording changes anew.
+        See `get_rect`.
+
+        """
+
+        changes = []
+
+        for widget, old_rect in Widget._rect_changes.items():
+
+            new_rect = widget.get_rect()
+
+            if new_rect != old_rect:
+                changes.append((widget, old_rect, new_rect))
+
+        Widget._rect_changes = {}
+
+        return changes
+
     @property
     def sizer(self):
 
@@ -101,66 +296,302 @@ class Widget:
 
         self._sizer = sizer
 
+        if self.sizer_cell and self.sizer_cell.sizer:
+            self.sizer_cell.sizer._invalidate_widget_index()
+
     @property
     def min_size(self):
 
-        return self._sizer.min_size if self._sizer else self._min_size
+        if self._sizer:
+            return self._sizer.min_size
+
+        if self._reserved_size:
+            w_min, h_min = self._min_size
+            w_r, h_r = self._reserved_size
+            return (max(w_min, w_r), max(h_min, h_r))
+
+        return self._min_size
 
     @min_size.setter
     def min_size(self, size):
 
-        self._min_size = w_min, h_min = size
+        self._min_size = size
+
+        if not self._is_reserved_size_fixed:
+            self.__grow_reserved_size()
+
+        w_min, h_min = self.min_size
         w, h = self._size
-        self._size = (max(w_min, w), max(h_min, h))
+        new_size = (max(w_min, w), max(h_min, h))
+
+        if new_size != self._size:
+            self._record_rect_change()
+
+        self._size = new_size
 
         if self._sizer:
             self._sizer.set_min_size_stale()
         elif self.sizer_cell:
             self.sizer_cell.sizer.set_min_size_stale()
 
+    def __grow_reserved_size(self):
+
+        w_min, h_min = self._min_size
+        w_r, h_r = self._reserved_size
+        self._reserved_size = (max(w_min, w_r), max(h_min, h_r))
+
+    def reserve_size(self, size=None):
+        """
+        Reserve space for this widget, so that a change to its contents (e.g.
+        its text) that still fits within that space only needs to update its
+        own frame, leaving the rest of the layout as is (see `reset_frame_size`).
+
+        If no size is given, the reserved size is the largest size measured for
+        this widget so far (a high-water mark), growing along with its contents.
+
+        """
+
+        if size is None:
+            self._reserved_size = self._min_size
+            self._is_reserved_size_fixed = False
+        else:
+            self._reserved_size = size
+            self._is_reserved_size_fixed = True
+
+        self.min_size = self._min_size
+
+    def clear_reserved_size(self):
+
+        self._reserved_size = None
+        self._is_reserved_size_fixed = True
+        self.min_size = self._min_size
+
+    @property
+    def height_for_width(self):
+        """
+        Whether the minimum height of this widget depends on the width assigned
+        to it.
+
+        This applies to widgets with word-wrapped text (as set through the
+        "text_wordwrap" option): their minimum width is the width measured with
+        the original wrap width, but when given more width, their text gets
+        rewrapped to fit and their minimum height is adjusted to the resulting
+        number of lines. The layout then needs a second pass to make room for
+        the new height (see `Sizer.update`, `Sizer.relayout` and `GUI.layout`).
+        The heights of wrapped texts are cached per text, text style and wrap
+        width, the latter rounded down to a multiple of `_wrap_width_step`, so
+        resizing through the same widths again does not measure any text anew.
+        Enabling this has no effect on widgets without word-wrapped text.
+
+        """
+
+        return self._text_wrap is not None
+
+    @height_for_width.setter
+    def height_for_width(self, height_for_width):
+
+        if height_for_width == self.height_for_width:
+            return
+
+        if height_for_width:
+            self.__init_text_wrap(self._min_size)
+        else:
+            self.__restore_text_wrap()
+            self._text_wrap = None
+
+    def __init_text_wrap(self, size):
+        """
+        Compute the metrics needed to rewrap the text of this widget, based on
+        the given size, measured with the original wrap width.
+
+        """
+
+        self._text_wrap = None
+        self._wrap_width = None
+
+        if not self.dgui_obj or not self.dgui_obj.hascomponent("text0"):
+            return
+
+        text_np = self.dgui_obj.component("text0")
+        text_node = text_np.textNode
+
+        if not text_node.has_wordwrap():
+            return
+
+        text_sx, text_sz = text_np.getTextScale()
+        sx, sz = self._style.scale
+        # the number of pixels per text unit
+        scale_x = sx * text_sx
+        scale_z = sz * text_sz
+        wrap_width = text_node.get_wordwrap()
+        w, h = size
+        # the width of the frame not taken up by the text
+        extra_width = w - text_node.get_width() * scale_x
+        font = text_node.get_font()
+        style_key = (font.get_name() if font else None, text_node.get_line_height(),
+            text_node.get_slant(), text_node.get_small_caps(),
+            text_node.get_glyph_scale(), text_node.get_glyph_shift())
+        text = text_node.get_text()
+        text_height = self.__get_wrapped_text_height(text_node, text, style_key,
+            wrap_width)
+        self._text_wrap = (wrap_width, extra_width, scale_x, scale_z, h,
+            text_height, text, style_key)
+        self._wrap_width = wrap_width
+
+    def __restore_text_wrap(self):
+
+        wrap_width = self._text_wrap[0]
+
+        if self._wrap_width != wrap_width:
+            self.dgui_obj["text_wordwrap"] = wrap_width
+            self._wrap_width = wrap_width
+            self._frame_size = None
+
+    @staticmethod
+    def __get_wrapped_text_height(text_node, text, style_key, wrap_width):
+
+        key = (text, style_key, wrap_width)
+        heights = Widget._wrapped_text_heights
+        height = heights.get(key)
+
+        if height is None:
+
+            measurer = TextNode("text_measurer", text_node)
+            measurer.set_wordwrap(wrap_width)
+            measurer.set_text(text)
+            height = measurer.get_height()
+
+            if len(heights) >= Widget._max_cached_text_heights:
+                del heights[next(iter(heights))]
+
+            heights[key] = height
+
+        return height
+
+    def __wrap_text(self, width):
+        """
+        Rewrap the text of this widget to fit the given width and update the
+        minimum height of this widget accordingly.
+
+        """
+
+        (orig_wrap_width, extra_width, scale_x, scale_z, orig_height,
+            orig_text_height, text, style_key) = self._text_wrap
+        step = Widget._wrap_width_step
+        wrap_width = ((width - extra_width) / scale_x // step) * step
+        wrap_width = max(orig_wrap_width, wrap_width)
+
+        if wrap_width == self._wrap_width:
+            return
+
+        self._wrap_width = wrap_width
+        self.dgui_obj["text_wordwrap"] = wrap_width
+        text_node = self.dgui_obj.component("text0").textNode
+        text_height = self.__get_wrapped_text_height(text_node, text, style_key,
+            wrap_width)
+
+        if self._style.text_align == TextNode.A_right:
+            self.update_style()
+
+        w_min, h_min = self._min_size
+        new_h_min = orig_height + int(round((text_height - orig_text_height) * scale_z))
+
+        if new_h_min == h_min:
+            return
+
+        self._min_size = (w_min, new_h_min)
+
+        if self.sizer_cell and self.sizer_cell.sizer:
+            # the sizers containing this widget need to adjust to its new
+            # minimum height in a next layout pass; invalidating their minimum
+            # sizes signals the need for that pass up to the root sizer (see
+            # `Sizer.update` and `Sizer.relayout`)
+            self.sizer_cell.sizer.set_min_size_stale()
+
+    def update_min_size(self):
+
+        return self._sizer.update_min_size() if self._sizer else self.min_size
+
     def get_size(self):
 
         return self._sizer.get_size() if self._sizer else self._size
 
-    def set_size(self, size):
+    def set_size(self, size, force=False):
+        """
+        Resize this widget and lay out its sizer, if any, to fit its new size.
+
+        If `force` is True, the layout of its sizer is assumed to have been
+        computed and applied by other means (see `layout_solver.apply_layout`),
+        so only the widget itself is resized. Subclasses can still adapt to that
+        layout, as it is up to date by then.
+
+        """
+
+        new_size = self.set_frame_size(size)
+
+        if self._sizer and not force:
+            self._sizer.set_size(new_size)
+
+        return new_size
+
+    def _get_frame_size(self):
+        """
+        Return the size last applied to the frame of the DirectGui object, or
+        None if this widget needs to be resized even if its size does not change
+        (see `layout_solver.apply_layout`).
+
+        """
+
+        return self._frame_size
+
+    def set_frame_size(self, size):
+        """
+        Resize the frame of the DirectGui object, without updating the layout
+        of the sizer of this widget, if any.
+
+        The frame is left as is if it already has the resulting size.
+
+        """
 
         width, height = size
+
+        if self._text_wrap:
+            self.__wrap_text(max(self.min_size[0], width))
+
         w_min, h_min = self.min_size
-        w_new = max(w_min, width)
-        h_new = max(h_min, height)
-        new_size = (w_new, h_new)
-        sx, _, sz = self.dgui_obj.get_scale()
-        l, r, b, t = self._bounds
+        new_size = (max(w_min, width), max(h_min, height))
 
-        if self.dgui_obj["relief"] not in (None, DGG.FLAT):
-            border_w, border_h = self.dgui_obj["borderWidth"]
-        else:
-            border_w = border_h = 0
+        if new_size != self._frame_size:
+            self.__set_frame(new_size)
+            self._frame_size = new_size
 
-        if self.dgui_obj.hascomponent("text0"):
+        if new_size != self.get_size():
+            self._record_rect_change()
 
-            text_node = self.dgui_obj.component("text0")
-            l_offset = r_offset = 0
+        self._size = new_size
 
-            if self.dgui_obj.hascomponent("indicator"):
+        return new_size
 
-                l_b, r_b, b_b, t_b = self.dgui_obj.indicator.guiItem.getFrame()
-                offset = r_b - l_b
+    def __set_frame(self, size):
 
-                if self.dgui_obj["boxPlacement"] == "left":
-                    l_offset = offset
-                else:
-                    r_offset = offset
+        w_new, h_new = size
+        style = self._style
+        sx, sz = style.scale
+        border_w, border_h = style.border_size
+        l, r, b, t = self._bounds
+        text_align = style.text_align
 
-            if text_node.align == TextNode.A_center:
+        if text_align is not None:
+
+            l_offset, r_offset = style.indicator_offsets
+
+            if text_align == TextNode.A_center:
                 l = (-w_new / sx - l_offset + r_offset) * .5
                 r = (w_new / sx - l_offset + r_offset) * .5
-            elif text_node.align == TextNode.A_right:
-                text_np = NodePath(text_node)
-                _, p = text_np.get_tight_bounds()
-                r = p[0] + border_w + r_offset
+            elif text_align == TextNode.A_right:
+                r = style.text_right + border_w + r_offset
                 l = r - w_new / sx
-            elif text_node.align == TextNode.A_left:
+            elif text_align == TextNode.A_left:
                 l = -border_w - l_offset
                 r = l + w_new / sx
 
@@ -173,7 +604,7 @@ class Widget:
 
         self._bounds = (l, r, b, t)
 
-        if self.dgui_obj.hascomponent("indicator"):
+        if style.has_indicator:
             l += border_w
             r -= border_w
             b += border_h
@@ -181,15 +612,294 @@ class Widget:
 
         self.dgui_obj["frameSize"] = (l, r, b, t)
 
-        if self.dgui_obj.hascomponent("popupMarker"):
-            marker = self.dgui_obj.component("popupMarker")
-            sx = marker.get_scale()[0]
-            b = self.dgui_obj["popupMarkerBorder"][0]
-            z = marker.get_pos()[2]
-            marker.set_pos(r - marker.getWidth() * .5 * sx - b, 0, z)
+        if style.popup_marker:
+            marker, marker_offset, z = style.popup_marker
+            marker.set_pos(r - marker_offset, 0, z)
+
+    def reset_frame_size(self):
+        """
+        Measure the DirectGui object anew, e.g. after its text was changed.
+
+        Return True if the layout is still up to date afterwards, or False if
+        it needs to be updated through a call to `GUI.layout`.
+        If a size was reserved for this widget (see `reserve_size`), only its
+        own frame is updated as long as its new size fits; otherwise just the
+        part of the layout affected by its growth is updated (see
+        `Sizer.relayout`).
+
+        """
+
+        old_min_size = self.min_size
+
+        # the text needs to be measured with its original wrap width
+        if self._text_wrap:
+            self.__restore_text_wrap()
+
+        self.dgui_obj["frameSize"] = None
+        self.dgui_obj.resetFrameSize()
+        w, h = self._measure()
+
+        # the minimum size of this widget is not updated yet, as it may still
+        # correspond to a rewrapped text
+        if self._text_wrap:
+            self.__init_text_wrap((w, h))
+
+        if self._reserved_size is None or self._sizer:
+            self.min_size = (w, h)
+            return False
+
+        w_r, h_r = self._reserved_size
+
+        if (max(w, w_r), max(h, h_r)) == old_min_size:
+
+            self._min_size = (w, h)
+            self.set_size(self._size)
+
+            if self._pos is not None:
+                self.set_pos(self._pos)
+
+            return True
+
+        self.min_size = (w, h)
+
+        if self.sizer_cell and self.sizer_cell.sizer:
+            return self.sizer_cell.sizer.relayout()
+
+        return False
+
+
+class LazyWidget(Widget):
+    """
+    A widget whose DirectGui object is created only when the widget first
+    appears on screen, e.g. because it is part of a panel that is initially
+    collapsed or scrolled out of view.
+
+    Until then, it takes part in the layout as a placeholder with an estimated
+    minimum size. If a cache key is given, the size measured once a widget
+    with that key was realized is used instead of the estimate for all lazy
+    widgets created afterwards with the same key.
+
+    """
+
+    # the minimum sizes measured for realized widgets, per cache key
+    _measured_sizes = {}
+    # whether any realized widget needs a different size than estimated
+    _is_layout_stale = False
+
+    def __init__(self, dgui_creator, parent, min_size=None, cache_key=None, **options):
+
+        # the given `dgui_creator` is called with the parent and the given
+        # options as keyword arguments and must return a new DirectGui object
+        self._dgui_creator = dgui_creator
+        self._parent = parent
+        self._options = options
+        self._cache_key = cache_key
+        measured_size = self._measured_sizes.get(cache_key)
+
+        if measured_size:
+            self._placeholder_size = measured_size
+        else:
+            self._placeholder_size = min_size if min_size else (0, 0)
+
+        Widget.__init__(self, None)
+
+        self._bounds = None
+        self._style = None
+
+    def destroy(self):
+
+        if self.dgui_obj:
+            Widget.destroy(self)
+            return
 
         if self._sizer:
-            self._sizer.set_size(new_size)
+            self._sizer.destroy()
+            self._sizer = None
+
+        self.sizer_cell = None
+        self._dgui_creator = None
+        self._options = None
+        Widget._rect_changes.pop(self, None)
+        Registry.unregister(self)
+
+        if self._pool:
+            self._pool._forget(self)
+
+    @property
+    def is_realized(self):
+
+        return self.dgui_obj is not None
+
+    def _measure(self):
+
+        if self.dgui_obj:
+            return Widget._measure(self)
+
+        return self._placeholder_size
+
+    def realize(self):
+        """
+        Create the DirectGui object of this widget, if not done already.
+
+        If the measured size differs from the estimated one, the layout needs
+        to be updated; `GUI.layout` takes care of this for widgets realized
+        during a layout update.
+
+        """
+
+        if self.dgui_obj:
+            return
+
+        self.dgui_obj = self._dgui_creator(parent=self._parent, **self._options)
+        self._dgui_creator = None
+        self._options = None
+
+        # the new DirectGui object needs to be stashed if this widget is in a
+        # hidden part of the layout (see `SizerCell.shown`)
+        if self.sizer_cell:
+            self.sizer_cell._update_stash(unstash=False)
+        old_min_size = self.min_size
+        min_size = self._measure()
+
+        if self._cache_key is not None:
+            self._measured_sizes[self._cache_key] = min_size
+
+        if min_size != self._min_size:
+
+            self.min_size = min_size
+
+            if self.min_size != old_min_size:
+                LazyWidget._is_layout_stale = True
+
+        self.set_size(self._size)
+
+        if self._pos is not None:
+            Widget.set_pos(self, self._pos)
+
+    @staticmethod
+    def pop_layout_stale():
+        """
+        Return whether any widget realized since the previous call needs a
+        different size than was estimated for it.
+
+        """
+
+        is_stale = LazyWidget._is_layout_stale
+        LazyWidget._is_layout_stale = False
+
+        return is_stale
+
+    def _is_on_screen(self):
+        """
+        Return whether this widget is positioned within the window as well as
+        within the visible part of the canvas of each scrolled frame containing
+        it (see `ScrolledFrameWidget.realize_visible`).
+
+        """
+
+        parent = self._parent
+
+        if self._pos is None or parent.is_empty() or parent.is_hidden():
+            return False
+
+        if not self.__overlaps(parent.get_top(), (-1., 1., -1., 1.)):
+            return False
+
+        for scrolled_frame in self.__iter_scrolled_frames():
+            if not self.__overlaps(scrolled_frame.dgui_obj,
+                    scrolled_frame._get_visible_frame()):
+                return False
+
+        return True
+
+    def __overlaps(self, node, frame):
+        """
+        Return whether this widget overlaps the given (left, right, bottom, top)
+        frame in the coordinate space of the given NodePath.
+
+        """
+
+        x, y = self._pos
+        w, h = self._size
+        parent = self._parent
+        l, _, t = node.get_relative_point(parent, Point3(x, 0., -y))
+        r, _, b = node.get_relative_point(parent, Point3(x + w, 0., -y - h))
+        f_l, f_r, f_b, f_t = frame
+
+        return min(l, r) <= f_r and max(l, r) >= f_l and min(b, t) <= f_t and max(b, t) >= f_b
+
+    def __iter_scrolled_frames(self):
+        """
+        Iterate over the scrolled frames whose canvas contains this widget,
+        directly or not, starting with the innermost one.
+
+        """
+
+        cell = self.sizer_cell
+
+        while cell and cell.sizer:
+
+            sizer = cell.sizer
+
+            while sizer.owner and sizer.owner.type == "sizer":
+                sizer = sizer.owner
+
+            widget = sizer.owner
+
+            if not widget:
+                return
+
+            if isinstance(widget, ScrolledFrameWidget) and sizer is widget.canvas_sizer:
+                yield widget
+
+            cell = widget.sizer_cell
+
+    def get_pos(self):
+
+        if self.dgui_obj:
+            return Widget.get_pos(self)
+
+        return self._pos if self._pos else (0, 0)
+
+    def reparent_to(self, parent):
+
+        if self.dgui_obj:
+            Widget.reparent_to(self, parent)
+        else:
+            self._parent = parent
+
+    def set_pos(self, pos):
+
+        if not self.dgui_obj:
+
+            if pos != self._pos:
+                self._record_rect_change()
+
+            self._pos = pos
+
+            # within a scrolled frame, this widget is realized by that frame
+            # once it has been laid out and positioned itself, as the visible
+            # part of its canvas is not known before then
+            is_in_scrolled_frame = next(self.__iter_scrolled_frames(), None) is not None
+
+            if not is_in_scrolled_frame and self._is_on_screen():
+                self.realize()
+
+            return
+
+        Widget.set_pos(self, pos)
+
+    def set_frame_size(self, size):
+
+        if self.dgui_obj:
+            return Widget.set_frame_size(self, size)
+
+        width, height = size
+        w_min, h_min = self.min_size
+        new_size = (max(w_min, width), max(h_min, height))
+
+        if new_size != self.get_size():
+            self._record_rect_change()
 
         self._size = new_size
 
@@ -197,19 +907,16 @@ class Widget:
 
     def reset_frame_size(self):
 
-        self.dgui_obj["frameSize"] = None
-        self.dgui_obj.resetFrameSize()
-        l, r, b, t = self._bounds = self._get_bounds(self.dgui_obj)
-        sx, _, sz = self.dgui_obj.get_scale()
-        w = int((r - l) * sx)
-        h = int((t - b) * sz)
-        self.min_size = (w, h)
+        if self.dgui_obj:
+            return Widget.reset_frame_size(self)
+
+        return True
 
 
 class ScrolledListWidget(Widget):
 
     def __init__(self, dgui_obj, scrollbtn_proportion, scrollbtn_borders,
-                 itemframe_borders, margins):
+                 itemframe_borders, margins, variable_heights=False):
 
         Widget.__init__(self, dgui_obj)
 
@@ -244,79 +951,542 @@ class ScrolledListWidget(Widget):
         sizer.add((0, dgui_obj["forceHeight"]))
 
         self._widgets = {}
+        # if True, each item takes up its own height instead of the height of
+        # the "forceHeight" option of the DirectScrolledList, and the items are
+        # scrolled based on the summed heights of the items before them
+        self._has_variable_heights = variable_heights
+        # the height available to the items in view
+        self._view_height = 0
+        # the DirectScrolledList will use an IndexedList to store its items,
+        # allowing them to be quickly inserted, removed and moved by index, as
+        # well as found by vertical offset if their heights are variable;
+        # if a filter or sort key is set (see `set_view`), it only contains
+        # the items in view, in view order
+        weight = self.__get_item_height if variable_heights else None
+        self._items = IndexedList(dgui_obj["items"], weight=weight)
+        dgui_obj["items"] = self._items
+        # all of the items, in the order they were added in
+        self._all_items = IndexedList(self._items)
+        # all of the items, in view order
+        self._ordered_items = self._all_items
+        self._filter = None
+        self._sort_key = None
+        self._sort_keys = {}
+        self._removed_cells = []
         self._item_sizer = Sizer("vertical")
         self._item_sizer.set_column_proportion(0, 1.)
+        # the minimum widths of the items, keeping track of the widest one, so
+        # the minimum size of the item sizer never needs to be computed
+        self._item_widths = MaxTracker()
+        self._max_item_width = 0
+        # the items currently in view
+        self._visible_items = []
+        self._is_refresh_needed = False
+        # the horizontal layout of the items is only updated for those in view;
+        # the others are updated when scrolled into view, if the ID of their
+        # layout differs from the current one
+        self._item_width = 0
+        self._item_layout_id = 0
+        self._item_layout_ids = {}
+
+        # replace the scrolling method of the DirectScrolledList, so only the
+        # items scrolled out of and into view need to be processed
+        dgui_obj.scrollTo = self.__scroll_to
 
         # provide camelCase aliases for DirectGui-like method names
         self.addItem = self.add_item
         self.removeItem = self.remove_item
 
-    def add_item(self, item, refresh=False, expand=True):
+    def add_item(self, item, refresh=False, expand=True, index=None):
 
-        w_min, h_min = self._item_sizer.min_size
-        self.dgui_obj.addItem(item, refresh)
+        dgui_obj = self.dgui_obj
+        # instead of `DirectScrolledList.addItem`, which can only append items,
+        # do what it does here
+        item.itemID = dgui_obj.nextItemID
+        dgui_obj.nextItemID += 1
         item_parent = self._item_root.attach_new_node("item_parent")
         item.reparent_to(item_parent)
+        item.hide()
         widget = Widget(item)
         self._widgets[item] = widget
-        alignments = ("expand" if expand else "min", "min")
-        self._item_sizer.add(widget, alignments=alignments, index=0)
-        max_width, _ = size = self._item_sizer.update_min_size()
-        self._item_sizer.update(size)
-        w, h = widget.get_size()
-        w_ = int(w * .5)
-        l, r, b, t = item["frameSize"]
-        item["frameSize"] = (-w_, w_, b, t)
 
-        if max_width > w_min:
-            self._item_root["frameSize"] = (-w_, w_, 0, 0)
-            self._root_widget._bounds = (-w_, w_, 0, 0)
-            self._root_widget.min_size = (w, 0)
+        if index is None:
+            self._all_items.append(item)
+        else:
+            self._all_items.insert(index, item)
+
+        if self._filter is None and self._sort_key is None:
+            if index is None:
+                self._items.append(item)
+            else:
+                self._items.insert(index, item)
+        else:
+            self.__add_to_view(item)
+
+        alignments = ("expand" if expand else "min", "min")
+        # the order of the cells in the item sizer is irrelevant, since it is
+        # only used to lay out the items horizontally
+        self._item_sizer.add(widget, alignments=alignments)
+        self._item_widths.add(widget.min_size[0])
+        self.__handle_item_change(refresh)
 
     def remove_item(self, item, refresh=False):
 
         item.get_parent().detach_node()
-        w_min, h_min = self._item_sizer.min_size
-        widget = self._widgets[item]
-        sizer_cell = widget.sizer_cell
+        self._all_items.remove(item)
+        self.__remove_from_view(item)
+        dgui_obj = self.dgui_obj
+
+        if getattr(dgui_obj, "currentSelected", None) is item:
+            del dgui_obj.currentSelected
+
+        item.reparent_to(ShowBaseGlobal.hidden)
+        widget = self._widgets.pop(item)
+        self._item_widths.remove(widget.min_size[0])
+        # the cell of the item will be removed from the item sizer along with
+        # the cells of other items removed before the next update
+        self._removed_cells.append(widget.sizer_cell)
         widget.sizer_cell = None
-        del self._widgets[item]
-        self._item_sizer.remove_cell(sizer_cell)
-        max_width, _ = size = self._item_sizer.update_min_size()
-        self._item_sizer.update(size)
 
-        if w_min > max_width:
+        if item in self._item_layout_ids:
+            del self._item_layout_ids[item]
+
+        if item in self._visible_items:
+            self._visible_items.remove(item)
+
+        self.__handle_item_change(refresh)
+
+        # like `DirectScrolledList.removeItem`, the items in view are updated
+        # right away in any case, while the item sizer may be updated later
+        if not refresh:
+            dgui_obj.refresh()
+
+    def remove_item_at(self, index, refresh=False):
+
+        self.remove_item(self._items[index], refresh)
+
+    def move_item(self, item, index, refresh=False):
+
+        if self._filter is None and self._sort_key is None:
+            self._all_items.move(item, index)
+            self._items.move(item, index)
+        else:
+            self._all_items.move(item, index)
+            self.__remove_from_view(item)
+            self.__add_to_view(item)
+
+        self.__handle_item_change(refresh)
+
+    def update_item_size(self, item, refresh=False):
+        """
+        Measure the given item anew, e.g. after its text was changed.
+
+        """
+
+        widget = self._widgets[item]
+        self._item_widths.remove(widget.min_size[0])
+        widget.reset_frame_size()
+        self._item_widths.add(widget.min_size[0])
+        # the horizontal layout of the item needs to be updated
+        self._item_layout_ids.pop(item, None)
+
+        if self._has_variable_heights and item in self._items:
+            self._items.update_weight(item)
+
+        self.__handle_item_change(refresh)
+
+    def __get_item_height(self, item):
+
+        widget = self._widgets.get(item)
+
+        return widget.min_size[1] if widget else self.dgui_obj["forceHeight"]
+
+    def __get_item_top(self, item):
+        """
+        Return the distance from the origin of the given item to its top.
+
+        """
+
+        widget = self._widgets.get(item)
+
+        if not widget:
+            return 0.
+
+        _, _, _, t = widget._bounds
+        _, sz = widget._style.scale
+
+        return t * sz
+
+    def get_content_height(self):
+        """
+        Return the summed height of the items in view.
+
+        """
+
+        if self._has_variable_heights:
+            return self._items.weight_sum
+
+        return len(self._items) * self.dgui_obj["forceHeight"]
+
+    def scroll_to_item(self, item, centered=False):
+
+        self.dgui_obj.scrollTo(self._items.index(item), centered)
+
+    def update_item(self, item, refresh=False):
+        """
+        Update the position of the given item in view after a change to the
+        data its sort key or filter result is based on (see `set_view`).
+
+        """
+
+        if self._filter is None and self._sort_key is None:
+            return
+
+        self.__remove_from_view(item)
+        self.__add_to_view(item)
+
+        if refresh:
+            self.dgui_obj.refresh()
+        else:
+            self._is_refresh_needed = True
+
+    def set_view(self, predicate=None, sort_key=None, narrowing=False):
+        """
+        Show only the items for which the given predicate (a callable taking an
+        item) returns True, sorted by the given key (a callable taking an item
+        and returning a value to sort by).
+
+        Items with equal keys, or all items if no sort key is given, remain in
+        the order they were added in (see `add_item` and `move_item`; the index
+        passed to those methods refers to that order, while `get_item`,
+        `get_item_index` and `remove_item_at` refer to the items in view).
+        If `narrowing` is True, the new predicate is assumed to only accept items
+        that the previous one accepted as well (e.g. after typing an additional
+        character in a search field), so only the items in view are checked.
+        Changing the view does not affect the layout of the items, nor the
+        width of the list, which always fits the widest of all items; only the
+        items scrolled out of and into view are processed.
+
+        """
+
+        is_order_changed = sort_key is not self._sort_key
+
+        if is_order_changed:
+
+            self._sort_key = sort_key
+
+            if sort_key is None:
+                self._ordered_items = self._all_items
+                self._sort_keys = {}
+            else:
+                self._sort_keys = keys = {item: sort_key(item) for item in self._all_items}
+                # Python's sort is stable, so items with equal keys remain in the
+                # order they were added in
+                ordered_items = sorted(self._all_items, key=keys.__getitem__)
+                self._ordered_items = IndexedList(ordered_items)
+
+        if predicate is None:
+            items = list(self._ordered_items)
+        elif narrowing and self._filter is not None and not is_order_changed:
+            items = [item for item in self._items if predicate(item)]
+        else:
+            items = [item for item in self._ordered_items if predicate(item)]
+
+        self._filter = predicate
+
+        if items != list(self._items):
+            self._items[:] = items
+
+        self.dgui_obj.refresh()
+
+    def __insert_ordered(self, item):
+        """
+        Insert the given item into the list of all items in view order, based
+        on its sort key and, for equal keys, the order of addition.
+
+        """
+
+        all_items = self._all_items
+        sort_keys = self._sort_keys
+        key = sort_keys[item] = self._sort_key(item)
+        order = (key, all_items.index(item))
+        ordered_items = self._ordered_items
+        lo = 0
+        hi = len(ordered_items)
+
+        while lo < hi:
+
+            mid = (lo + hi) // 2
+            other = ordered_items[mid]
+
+            if (sort_keys[other], all_items.index(other)) < order:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        ordered_items.insert(lo, item)
+
+    def __add_to_view(self, item):
+
+        if self._sort_key:
+            self.__insert_ordered(item)
+
+        if self._filter and not self._filter(item):
+            return
+
+        # find the index of the item in view, based on its index in the list of
+        # all items in view order
+        ordered_items = self._ordered_items
+        order = ordered_items.index(item)
+        items = self._items
+        lo = 0
+        hi = len(items)
+
+        while lo < hi:
+
+            mid = (lo + hi) // 2
+
+            if ordered_items.index(items[mid]) < order:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        items.insert(lo, item)
+
+    def __remove_from_view(self, item):
+
+        if self._sort_key:
+            self._ordered_items.remove(item)
+            del self._sort_keys[item]
+
+        if item in self._items:
+            self._items.remove(item)
+
+    def get_item(self, index):
+
+        return self._items[index]
+
+    def get_item_index(self, item):
+
+        return self._items.index(item)
+
+    def __handle_item_change(self, refresh):
+
+        # the list needs to be resized if the width of the widest item changed
+        if self.__get_max_item_width() != self._max_item_width:
+            self._list_sizer.set_min_size_stale()
+
+        if refresh:
+            self.__update_item_sizer()
+            self.dgui_obj.refresh()
+        else:
+            self._is_refresh_needed = True
+
+    def __update_item_sizer(self):
+        """
+        Update the item sizer for all of the items added and removed since the
+        previous update, and resize the list if the widest item changed.
+
+        """
+
+        if self._removed_cells:
+            self._item_sizer.remove_cells(self._removed_cells)
+            self._removed_cells = []
+
+        max_width = self.__get_max_item_width()
+
+        if max_width != self._max_item_width:
+            self._max_item_width = max_width
             w_ = int(max_width * .5)
             self._item_root["frameSize"] = (-w_, w_, 0, 0)
             self._root_widget._bounds = (-w_, w_, 0, 0)
             self._root_widget.min_size = (max_width, 0)
-            self._list_sizer.set_min_size_stale()
+            # the horizontal layout of all items needs to be updated
+            self._item_layout_id += 1
+
+    def __get_max_item_width(self):
+
+        max_width = self._item_widths.max
 
-        self.dgui_obj.removeItem(item, refresh)
+        return 0 if max_width is None else max_width
 
-    def set_size(self, size):
+    def update_min_size(self):
 
-        new_size = Widget.set_size(self, size)
+        self.__update_item_sizer()
+
+        return Widget.update_min_size(self)
+
+    def _get_frame_size(self):
+
+        # the items in view need to adapt to the layout whenever it is applied
+        # (see `set_size`)
+        return None
+
+    def set_size(self, size, force=False):
+
+        new_size = Widget.set_size(self, size, force)
 
         w, h = self._list_sizer.get_size()
         w = self._item_root.getWidth()
         w_ = w * .5
         self._item_root["frameSize"] = (-w_, w_, 0, 0)
         self._root_widget._bounds = (-w_, w_, 0, 0)
-        self._item_sizer.set_size((w, 0))
 
-        for item in self._widgets:
-            l, r, b, t = item["frameSize"]
-            sx, _, sz = item.get_scale()
-            w_ = int((r - l) * .5) / sx
-            item.get_parent().set_x(-w_ - l)
+        if w != self._item_width:
+            self._item_width = w
+            self._item_layout_id += 1
+
+        for item in self._visible_items:
+            self.__update_item_layout(item)
 
         item_height = self.dgui_obj["forceHeight"]
-        self.dgui_obj["numItemsVisible"] = int((h - item_height * .5) // item_height)
-        self.dgui_obj.refresh()
+        view_height = h - item_height * .5
+
+        if self._has_variable_heights:
+            if view_height != self._view_height or self._is_refresh_needed:
+                self._view_height = view_height
+                self.dgui_obj.refresh()
+            return new_size
+
+        num_items_visible = int(view_height // item_height)
+
+        if num_items_visible != self.dgui_obj["numItemsVisible"] or self._is_refresh_needed:
+            self.dgui_obj["numItemsVisible"] = num_items_visible
+            self.dgui_obj.refresh()
 
         return new_size
 
+    def __update_item_layout(self, item):
+
+        if item not in self._widgets or self._item_layout_ids.get(item) == self._item_layout_id:
+            return
+
+        self._item_layout_ids[item] = self._item_layout_id
+        # set the size the item sizer would assign to the cell of the item
+        cell = self._widgets[item].sizer_cell
+        _, h_min = cell.min_size
+        cell.set_size((max(self._max_item_width, self._item_width), h_min))
+        l, r, b, t = item["frameSize"]
+        sx, _, sz = item.get_scale()
+        w_ = int((r - l) * .5) / sx
+        item.get_parent().set_x(-w_ - l)
+
+    def __scroll_to(self, index, centered=0):
+        """
+        Replacement for `DirectScrolledList.scrollTo`, which shows or hides
+        *all* items whenever the list is scrolled or refreshed, while this
+        method only processes the items scrolled out of and into view.
+
+        """
+
+        dgui_obj = self.dgui_obj
+        items = dgui_obj["items"]
+        num_items = len(items)
+        inc_button = dgui_obj.incButton
+        dec_button = dgui_obj.decButton
+
+        if self._has_variable_heights:
+            index, last_index = self.__get_variable_scroll_range(index, centered)
+        else:
+            num_items_visible = dgui_obj["numItemsVisible"]
+            if centered:
+                index -= num_items_visible // 2
+            last_index = num_items - num_items_visible
+
+        ret = 0
+
+        if last_index <= 0:
+            index = 0
+            inc_button["state"] = DGG.DISABLED
+            dec_button["state"] = DGG.DISABLED
+        elif index <= 0:
+            index = 0
+            dec_button["state"] = DGG.DISABLED
+            inc_button["state"] = DGG.NORMAL
+        elif index >= last_index:
+            index = last_index
+            inc_button["state"] = DGG.DISABLED
+            dec_button["state"] = DGG.NORMAL
+        else:
+            if DGG.DISABLED in (inc_button["state"], dec_button["state"]):
+                taskMgr.remove(dgui_obj.taskName("scroll"))
+            inc_button["state"] = DGG.NORMAL
+            dec_button["state"] = DGG.NORMAL
+            ret = 1
+
+        dgui_obj.index = index
+
+        for item in self._visible_items:
+            item.hide()
+
+        if self._has_variable_heights:
+            # the items fully fitting within the view, or at least one item
+            offset = items.get_weight_sum(index)
+            end_index = items.get_index_at_weight(offset + self._view_height)
+            num_items_visible = max(min(1, num_items - index), end_index - index)
+            dgui_obj["numItemsVisible"] = num_items_visible
+
+        self._visible_items = visible_items = items[index:index + num_items_visible]
+        self._is_refresh_needed = False
+
+        if self._has_variable_heights:
+
+            # the top of the first item is placed halfway the space above the
+            # item root, as reserved by the item sizer (cf. `set_size`)
+            z = dgui_obj["forceHeight"] * .5
+
+            for item in visible_items:
+                self.__update_item_layout(item)
+                item.show()
+                item.set_pos(0, 0, z - self.__get_item_top(item))
+                z -= items.get_weight(item)
+
+        else:
+
+            item_height = dgui_obj.maxHeight
+
+            for i, item in enumerate(visible_items):
+                self.__update_item_layout(item)
+                item.show()
+                item.set_pos(0, 0, -i * item_height)
+
+        if dgui_obj["command"]:
+            dgui_obj["command"](*dgui_obj["extraArgs"])
+
+        return ret
+
+    def __get_variable_scroll_range(self, index, centered):
+        """
+        Return the index of the first item to show when scrolling to the item
+        at the given index, as well as the largest index of the first item
+        that still allows the view to be filled, based on the heights of the
+        items.
+
+        """
+
+        items = self._items
+        num_items = len(items)
+        view_height = self._view_height
+
+        if centered and 0 <= index < num_items:
+            # center the item at the given index in the view
+            offset = items.get_weight_sum(index) + items.get_weight(items[index]) * .5
+            index = items.get_index_at_weight(offset - view_height * .5)
+
+        # the last items fully fit within the view if the summed height of the
+        # items before them is at least the height not taken up by them
+        offset = items.weight_sum - view_height
+
+        if offset <= 0:
+            return index, 0
+
+        last_index = items.get_index_at_weight(offset)
+
+        if items.get_weight_sum(last_index) < offset:
+            last_index += 1
+
+        return index, last_index
+
 
 class ScrolledFrameWidget(Widget):
 
@@ -324,24 +1494,106 @@ class ScrolledFrameWidget(Widget):
 
         Widget.__init__(self, dgui_obj)
 
-        self.scroll_dir = scroll_dir
+        self._scroll_dir = scroll_dir
+        # the canvas sizer is owned by this widget, such that changes to the
+        # contents of the canvas invalidate the minimum size of this widget
         self.canvas_sizer = Sizer("vertical")
+        self.canvas_sizer.owner = self
+        # the minimum size of this widget, depending on its scroll direction,
+        # scrollbar width, border and the minimum size of the canvas sizer;
+        # it is only recomputed when the sizer containing this widget gets
+        # its minimum size updated, as a change to any of those invalidates it
+        self._frame_min_size = self.__compute_min_size()
+
+        # lazy widgets scrolled into view need to be realized
+        for scrollbar in (dgui_obj.verticalScroll, dgui_obj.horizontalScroll):
+            scrollbar["command"] = self.realize_visible
+
+    def get_content_parent(self):
+
+        return self.dgui_obj.getCanvas()
+
+    def _get_visible_frame(self):
+        """
+        Return the part of the frame through which the canvas is visible, as a
+        (left, right, bottom, top) tuple in the coordinate space of the
+        DirectGui object.
+
+        """
+
+        gui_item = self.dgui_obj.guiItem
+        # the clip frame and the offset of the canvas are otherwise only
+        # updated when the frame gets rendered
+        gui_item.recompute()
+
+        return tuple(gui_item.get_clip_frame())
+
+    def realize_visible(self):
+        """
+        Realize the lazy widgets in the canvas sizer that are within the visible
+        part of the canvas (see `LazyWidget`), including those in the canvas of
+        any scrolled frame in that sizer.
+
+        This is done automatically whenever this widget is positioned by its
+        sizer or scrolled through its scrollbars.
+        Return False if any of those widgets needs a different size than was
+        estimated for it, in which case `GUI.layout` needs to be called (this
+        is taken care of if the widgets are realized during a layout update).
+
+        """
+
+        is_layout_up_to_date = True
+
+        for widget in self.canvas_sizer.iter_widgets(
+                widget_type=(LazyWidget, ScrolledFrameWidget), shown_only=True):
+
+            if isinstance(widget, ScrolledFrameWidget):
+
+                if not widget.realize_visible():
+                    is_layout_up_to_date = False
+
+                continue
+
+            if widget.is_realized or not widget._is_on_screen():
+                continue
+
+            min_size = widget.min_size
+            widget.realize()
+
+            if widget.min_size != min_size:
+                is_layout_up_to_date = False
+
+        return is_layout_up_to_date
+
+    def set_pos(self, pos):
+
+        Widget.set_pos(self, pos)
+        self.realize_visible()
 
     @property
-    def min_size(self):
+    def scroll_dir(self):
+
+        return self._scroll_dir
+
+    @scroll_dir.setter
+    def scroll_dir(self, scroll_dir):
+
+        self._scroll_dir = scroll_dir
+        self.min_size = self._min_size
+
+    def __compute_min_size(self):
 
         w, h = self._min_size
         bar_width = self.dgui_obj["scrollBarWidth"]
-        w_min = w if self.scroll_dir in ("", "horizontal") else w + bar_width
-        h_min = h if self.scroll_dir in ("", "vertical") else h + bar_width
-        self.canvas_sizer.default_size = (0, 0)
+        w_min = w if self._scroll_dir in ("", "horizontal") else w + bar_width
+        h_min = h if self._scroll_dir in ("", "vertical") else h + bar_width
         w, h = self.canvas_sizer.update_min_size()
-        w += 0 if self.scroll_dir in ("", "horizontal") else bar_width
-        h += 0 if self.scroll_dir in ("", "vertical") else bar_width
+        w += 0 if self._scroll_dir in ("", "horizontal") else bar_width
+        h += 0 if self._scroll_dir in ("", "vertical") else bar_width
 
-        if self.scroll_dir in ("", "vertical"):
+        if self._scroll_dir in ("", "vertical"):
             w_min = max(w_min, w)
-        if self.scroll_dir in ("", "horizontal"):
+        if self._scroll_dir in ("", "horizontal"):
             h_min = max(h_min, h)
 
         if self.dgui_obj["relief"] not in (None, DGG.FLAT):
@@ -349,14 +1601,37 @@ class ScrolledFrameWidget(Widget):
             w_min += int(ceil(border_w * 2))
             h_min += int(ceil(border_h * 2))
 
-        if self.sizer_cell:
-            self.sizer_cell.sizer.set_min_size_stale()
-
         return (w_min, h_min)
 
-    def set_size(self, size):
+    @property
+    def min_size(self):
+
+        return self._frame_min_size
+
+    @min_size.setter
+    def min_size(self, size):
+
+        self._min_size = size
+        self._frame_min_size = self.__compute_min_size()
+        Widget.min_size.fset(self, size)
+
+    def update_min_size(self):
+
+        self._frame_min_size = self.__compute_min_size()
+
+        return self._frame_min_size
+
+    def _get_frame_size(self):
+
+        # the canvas sizer needs to be laid out whenever the layout is applied
+        # (see `set_size`)
+        return None
 
-        w, h = new_size = Widget.set_size(self, size)
+    def set_size(self, size, force=False):
+
+        # the canvas sizer is not part of the layout computed by the solver
+        # (see `layout_solver.apply_layout`), so it is always laid out here
+        w, h = new_size = Widget.set_size(self, size, force)
 
         if self.dgui_obj["relief"] not in (None, DGG.FLAT):
             border_w, border_h = self.dgui_obj["borderWidth"]
@@ -365,16 +1640,158 @@ class ScrolledFrameWidget(Widget):
 
         bar_width = self.dgui_obj["scrollBarWidth"]
 
-        if self.scroll_dir in ("both", "vertical"):
+        if self._scroll_dir in ("both", "vertical"):
             w -= bar_width
 
-        if self.scroll_dir in ("both", "horizontal"):
+        if self._scroll_dir in ("both", "horizontal"):
             h -= bar_width
 
-        self.canvas_sizer.default_size = (w, h)
-        min_size = self.canvas_sizer.min_size
-        self.canvas_sizer.update(min_size)
+        # the canvas needs to fill at least the visible area of the frame
+        self.canvas_sizer.update((w, h))
         w, h = self.canvas_sizer.get_size()
         self.dgui_obj["canvasSize"] = (0, w, -h, 0)
 
         return new_size
+
+
+class WidgetPool:
+    """
+    Keep widgets that are no longer needed around for later reuse, instead of
+    destroying them and creating new ones from scratch.
+
+    Each pooled widget is created from a template, registered under a key
+    together with a function that creates the DirectGui object to be wrapped.
+
+    """
+
+    def __init__(self):
+
+        # the node that released DirectGui objects are parented to, keeping them
+        # out of sight and unresponsive to input
+        self._root = NodePath("widget_pool")
+        self._templates = {}
+        self._released_widgets = {}
+        # the widgets in any of the lists of released widgets
+        self._released = set()
+        # the template key of each widget created by this pool
+        self._keys = {}
+
+    def destroy(self):
+
+        self.clear()
+
+        # the widgets still in use are no longer tracked by this pool
+        for widget in self._keys:
+            widget._pool = None
+
+        self._templates = {}
+        self._keys = {}
+        self._root.remove_node()
+
+    def add_template(self, key, dgui_creator, widget_type=Widget):
+        """
+        Register a template under the given key.
+
+        The given `dgui_creator` is called whenever a widget is acquired for
+        this template while no released one is available; it is passed the
+        parent and the options that were passed to `acquire` as keyword
+        arguments and must return a new DirectGui object, which will be wrapped
+        in a widget of the given type.
+
+        """
+
+        self._templates[key] = (dgui_creator, widget_type)
+        self._released_widgets.setdefault(key, [])
+
+    def acquire(self, key, parent, **options):
+        """
+        Return a widget for the template with the given key, parented to the
+        given NodePath.
+
+        A previously released widget is reused if available; the given options
+        (e.g. `text`) are applied to its DirectGui object, which then gets
+        measured anew. Note that these options need to be configurable after
+        the object was created.
+
+        """
+
+        released_widgets = self._released_widgets[key]
+
+        if not released_widgets:
+            dgui_creator, widget_type = self._templates[key]
+            widget = widget_type(dgui_creator(parent=parent, **options))
+            widget._pool = self
+            self._keys[widget] = key
+            return widget
+
+        widget = released_widgets.pop()
+        self._released.remove(widget)
+        dgui_obj = widget.dgui_obj
+        dgui_obj.reparent_to(parent)
+
+        if options:
+
+            for option, value in options.items():
+                dgui_obj[option] = value
+
+            widget.reset_frame_size()
+
+        return widget
+
+    def release(self, widget):
+        """
+        Remove the given widget from the sizer it is in (without destroying
+        it) and keep it for reuse by a later call to `acquire`.
+
+        """
+
+        if widget in self._released:
+            raise ValueError("WidgetPool.release(x): x was already released")
+
+        key = self._keys[widget]
+        cell = widget.sizer_cell
+
+        if cell:
+
+            if cell.sizer:
+                cell.sizer.remove_cell(cell)
+
+            widget.sizer_cell = None
+
+        # the DirectGui object got stashed if the widget was in a hidden part of
+        # the layout, while an acquired widget needs to be visible
+        dgui_obj = widget.dgui_obj
+        dgui_obj.unstash()
+        dgui_obj.reparent_to(self._root)
+        self._released_widgets[key].append(widget)
+        self._released.add(widget)
+
+    def _forget(self, widget):
+        """
+        Stop keeping track of the given widget, as it is being destroyed (e.g.
+        along with the sizer it is in).
+
+        """
+
+        key = self._keys.pop(widget, None)
+
+        if widget in self._released:
+            self._released.remove(widget)
+            self._released_widgets[key].remove(widget)
+
+    def clear(self):
+        """
+        Destroy all of the widgets that were released to this pool.
+
+        """
+
+        for widgets in self._released_widgets.values():
+
+            for widget in widgets:
+                del self._keys[widget]
+                widget._pool = None
+                widget.destroy()
+
+            widgets.clear()
+
+        self._released.clear()
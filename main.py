@@ -2,7 +2,7 @@
 
 # Author: Epihaius
 # Date: 2019-09-23
-# Last revision: 2020-10-08
+# Last revision: 2026-10-19
 #
 # This is a basic example of how to use the sizer-based GUI system.
 
@@ -26,6 +26,18 @@ class MyApp:
         # initialize the GUI system
         self.gui = gui = GUI(showbase)
 
+        # create a pool of widgets that can be reused after they have been
+        # removed from the layout, saving the cost of creating new ones
+        self.widget_pool = pool = WidgetPool()
+
+        def create_button(parent, command):
+
+            return DirectButton(parent=parent, text=("Feel free to remove me", "Goodbye!",
+                "Yeah I'm still here", "Nobody home"), borderWidth=(6, 6),
+                text_scale=20, command=command)
+
+        pool.add_template("removable_button", create_button)
+
         # Build the GUI layout
 
         # add a horizontally expanding title bar
@@ -114,6 +126,10 @@ class MyApp:
             textMayChange=1, frameSize=(0, 0, -10, 10), text_scale=20,
             text_align=TextNode.A_left)
         widget = Widget(label)
+        # reserve space for the status text, such that changing it only requires
+        # the status bar itself to be updated as long as the new text fits
+        # (see `Widget.reset_frame_size`)
+        widget.reserve_size()
         borders = (10, 10, 10, 20)
         gui.sizer.add(widget, proportions=(1., 0.), borders=borders)
 
@@ -183,13 +199,14 @@ class MyApp:
 
         def remove_button():
 
-            self.frame_sizer.remove_cell(widget.sizer_cell, destroy=True)
+            # instead of destroying the button, release it to the pool, so it
+            # can be reused the next time a button needs to be added
+            self.widget_pool.release(widget)
             self.gui.layout()
 
-        button = DirectButton(parent=self.frame, text=("Feel free to remove me", "Goodbye!",
-            "Yeah I'm still here", "Nobody home"), borderWidth=(6, 6),
-            text_scale=20, command=remove_button)
-        widget = Widget(button)
+        # reuse a previously removed button if possible, or create a new one
+        widget = self.widget_pool.acquire("removable_button", self.frame,
+            command=remove_button)
         borders = (10, 10, 10, 10)
         # add the button to the frame, below the right-aligned text label, using index=1
         self.frame_sizer.add(widget, proportions=(1., 0.), borders=borders, index=1)
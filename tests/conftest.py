@@ -0,0 +1,96 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module sets up an offscreen Panda3D window for the tests, as well as GUI
+# instances whose window size can be changed without resizing an actual window.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from panda3d.core import loadPrcFileData, WindowProperties
+
+loadPrcFileData("", "window-type offscreen\nload-display p3tinydisplay\n"
+    "audio-library-name null\nwin-size 800 600")
+
+import pytest
+from direct.showbase.ShowBase import ShowBase
+from gui import GUI
+
+
+class FakeWindow:
+
+    def __init__(self, size):
+
+        self._props = WindowProperties()
+        self._props.set_size(*size)
+
+    def get_properties(self):
+
+        return self._props
+
+    def request_properties(self, props):
+
+        pass
+
+    def set_size(self, width, height):
+
+        self._props.set_size(width, height)
+
+
+class FakeShowBase:
+
+    def __init__(self, showbase, window):
+
+        self.win = window
+        self.pixel2d = showbase.pixel2d
+
+
+@pytest.fixture(scope="session")
+def showbase():
+
+    return ShowBase()
+
+
+@pytest.fixture
+def gui_root(showbase):
+
+    root = showbase.pixel2d.attach_new_node("gui_root")
+    yield root
+    root.remove_node()
+
+
+@pytest.fixture
+def make_gui(showbase):
+    """
+    Return a function creating a GUI for a window of the given size; the GUIs
+    are destroyed after the test.
+
+    """
+
+    guis = []
+
+    def make_gui(window=None):
+
+        gui = GUI(FakeShowBase(showbase, window if window else FakeWindow((800, 600))))
+        guis.append(gui)
+
+        return gui
+
+    yield make_gui
+
+    for gui in guis:
+        gui.sizer.destroy()
+
+
+@pytest.fixture
+def window():
+
+    return FakeWindow((800, 600))
+
+
+@pytest.fixture
+def gui(make_gui, window):
+
+    return make_gui(window)
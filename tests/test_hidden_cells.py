@@ -0,0 +1,109 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for hiding sizer cells (see `SizerCell.shown`).
+
+from direct.gui.DirectGui import DirectButton
+from gui import Sizer, Widget, LazyWidget, WidgetPool
+
+
+def create_button(parent, text):
+
+    return Widget(DirectButton(parent=parent, text=text, text_scale=20,
+        borderWidth=(2, 2)))
+
+
+def get_geometry(widgets):
+
+    return [widget.get_rect() for widget in widgets]
+
+
+def test_hiding_and_showing_spacer(gui, gui_root):
+
+    widgets = [create_button(gui_root, "one"), create_button(gui_root, "two")]
+    gui.sizer.add(widgets[0])
+    spacer_cell = gui.sizer.add((0, 50))
+    gui.sizer.add(widgets[1])
+    gui.layout()
+    geometry = get_geometry(widgets)
+
+    spacer_cell.shown = False
+    gui.layout()
+
+    assert widgets[1].get_rect()[1] == geometry[1][1] - 50
+
+    spacer_cell.shown = True
+    gui.layout()
+
+    assert get_geometry(widgets) == geometry
+
+
+def test_hiding_and_showing_widget(gui, gui_root):
+
+    widgets = [create_button(gui_root, text) for text in ("one", "two", "three")]
+
+    for widget in widgets:
+        gui.sizer.add(widget)
+
+    gui.layout()
+    geometry = get_geometry(widgets)
+    cell = widgets[1].sizer_cell
+    cell.shown = False
+    gui.layout()
+
+    assert widgets[1].dgui_obj.is_stashed()
+    assert widgets[2].get_rect()[1] == geometry[1][1]
+
+    cell.shown = True
+    gui.layout()
+
+    assert not widgets[1].dgui_obj.is_stashed()
+    assert get_geometry(widgets) == geometry
+
+
+def test_widget_added_to_hidden_sizer(gui, gui_root):
+
+    sizer = Sizer("vertical")
+    cell = gui.sizer.add(sizer)
+    cell.shown = False
+    widget = create_button(gui_root, "hidden")
+    sizer.add(widget)
+
+    assert widget.dgui_obj.is_stashed()
+
+    cell.shown = True
+
+    assert not widget.dgui_obj.is_stashed()
+
+
+def test_lazy_widget_realized_in_hidden_sizer(gui, gui_root):
+
+    sizer = Sizer("vertical")
+    cell = gui.sizer.add(sizer)
+    widget = LazyWidget(DirectButton, gui_root, text="lazy", text_scale=20)
+    sizer.add(widget)
+    cell.shown = False
+    widget.realize()
+
+    assert widget.dgui_obj.is_stashed()
+
+    cell.shown = True
+
+    assert not widget.dgui_obj.is_stashed()
+
+
+def test_pooled_widget_released_from_hidden_sizer(gui, gui_root):
+
+    pool = WidgetPool()
+    pool.add_template("button", DirectButton)
+    sizer = Sizer("vertical")
+    cell = gui.sizer.add(sizer)
+    widget = pool.acquire("button", gui_root, text="pooled", text_scale=20)
+    sizer.add(widget)
+    cell.shown = False
+    pool.release(widget)
+
+    assert pool.acquire("button", gui_root) is widget
+    assert not widget.dgui_obj.is_stashed()
+
+    pool.destroy()
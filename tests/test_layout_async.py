@@ -0,0 +1,108 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for spreading the layout computation over multiple
+# frames (see `GUI.layout_async`).
+
+from panda3d.core import NodePath
+from direct.gui.DirectGui import DirectButton, DirectFrame
+from gui import Sizer, Widget
+from time import process_time
+import gc
+
+
+def run_async_layout(gui, showbase, time_slice):
+    """
+    Update the layout of the given GUI asynchronously and return the resulting
+    changes, along with the processor time taken by each frame (which, unlike
+    the elapsed time, does not include time during which other processes ran).
+
+    """
+
+    # the first frame may take longer for reasons unrelated to the layout, as
+    # may a frame in which garbage gets collected
+    showbase.taskMgr.step()
+    task = gui.layout_async(time_slice)
+    frame_times = []
+    gc.disable()
+
+    try:
+        while not task.done():
+            start_time = process_time()
+            showbase.taskMgr.step()
+            frame_times.append(process_time() - start_time)
+    finally:
+        gc.enable()
+
+    return task.result(), frame_times
+
+
+def test_async_layout_matches_sync_layout(make_gui, gui_root, showbase):
+
+    guis = (make_gui(), make_gui())
+    widgets = ([], [])
+
+    for gui, gui_widgets in zip(guis, widgets):
+
+        for i in range(3):
+
+            row = Sizer("horizontal", gaps=(5, 0))
+            gui.sizer.add(row, proportions=(1., 1.))
+
+            for j in range(i + 1):
+                widget = Widget(DirectButton(parent=gui_root, text="button " * (j + 1),
+                    text_scale=20, borderWidth=(2, 2)))
+                row.add(widget, proportions=(1., 1.))
+                gui_widgets.append(widget)
+
+    changes = guis[0].layout()
+    async_changes, frame_times = run_async_layout(guis[1], showbase, 100)
+
+    assert [c[1:] for c in async_changes] == [c[1:] for c in changes]
+    assert [w.get_rect() for w in widgets[1]] == [w.get_rect() for w in widgets[0]]
+
+
+def test_async_layout_stays_within_time_slice(gui, showbase):
+
+    # the widgets are not rendered, so only the layout itself takes time
+    parent = NodePath("parent")
+    widgets = []
+
+    for i in range(50):
+
+        row = Sizer("horizontal")
+        gui.sizer.add(row, proportions=(1., 0.))
+
+        for j in range(40):
+            widget = Widget(DirectFrame(parent=parent, frameSize=(0, 10, -5, 5)))
+            row.add(widget, proportions=(1., 0.))
+            widgets.append(widget)
+
+    gui.layout()
+    widgets[0].min_size = (10, 20)
+    start_time = process_time()
+    gui.layout()
+    sync_time = process_time() - start_time
+    widgets[0].min_size = (10, 30)
+    changes, frame_times = run_async_layout(gui, showbase, 500)
+
+    assert len(changes) == len(widgets)
+    # the layout is applied within the last frame, while the minimum sizes, the
+    # snapshot and the layout itself are computed cell by cell in the frames
+    # before that
+    assert max(frame_times[:-1]) < sync_time * .25
+
+
+def test_async_layout_of_flat_sizer_is_spread_over_frames(gui, showbase):
+
+    parent = NodePath("parent")
+
+    for i in range(1000):
+        widget = Widget(DirectFrame(parent=parent, frameSize=(0, 10, -5, 5)))
+        gui.sizer.add(widget, proportions=(1., 0.))
+
+    changes, frame_times = run_async_layout(gui, showbase, 100)
+
+    assert len(changes) == 1000
+    # the cells of a single sizer are processed in multiple steps as well
+    assert len(frame_times) > 10
@@ -0,0 +1,61 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for `LazyWidget`.
+
+from direct.gui import DirectGuiGlobals as DGG
+from direct.gui.DirectGui import DirectButton, DirectScrolledFrame
+from gui import LazyWidget, ScrolledFrameWidget
+
+
+def create_scrolled_frame(gui, gui_root, item_count):
+    """
+    Create a scrolled frame taking up the top half of the window, containing
+    lazy widgets. Return the scrolled frame widget and the lazy widgets.
+
+    """
+
+    frame = DirectScrolledFrame(parent=gui_root, scrollBarWidth=20,
+        relief=DGG.FLAT)
+    frame_widget = ScrolledFrameWidget(frame, "vertical")
+    gui.sizer.add(frame_widget, proportions=(1., 1.))
+    gui.sizer.add((0, 0), proportions=(0., 1.))
+    canvas = frame_widget.get_content_parent()
+    widgets = []
+
+    for i in range(item_count):
+        widget = LazyWidget(DirectButton, canvas, min_size=(100, 30),
+            text="item {:d}".format(i), text_scale=20)
+        frame_widget.canvas_sizer.add(widget, proportions=(1., 0.))
+        widgets.append(widget)
+
+    return frame_widget, widgets
+
+
+def test_widgets_outside_of_frame_are_not_realized(gui, gui_root):
+
+    frame_widget, widgets = create_scrolled_frame(gui, gui_root, 100)
+    gui.layout()
+    realized_widgets = [widget for widget in widgets if widget.is_realized]
+    frame_height = frame_widget.get_size()[1]
+    item_height = widgets[0].get_size()[1]
+
+    # only the widgets within the frame are realized, even though the widgets
+    # below it are within the window
+    assert realized_widgets == widgets[:len(realized_widgets)]
+    assert 0 < len(realized_widgets) <= frame_height // item_height + 1
+
+
+def test_scrolling_realizes_widgets(gui, gui_root, showbase):
+
+    frame_widget, widgets = create_scrolled_frame(gui, gui_root, 100)
+    gui.layout()
+
+    assert not widgets[-1].is_realized
+
+    frame_widget.dgui_obj.verticalScroll["value"] = 1.
+    # let the scrollbar handle the change
+    showbase.taskMgr.step()
+
+    assert widgets[-1].is_realized
+    assert not widgets[len(widgets) // 2].is_realized
@@ -0,0 +1,98 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for moving cells between sizers (see
+# `Sizer.move_cell`).
+
+from direct.gui.DirectGui import DirectButton, DirectFrame
+from gui import Sizer, Widget
+
+
+def create_button(parent, text):
+
+    return Widget(DirectButton(parent=parent, text=text, text_scale=20,
+        borderWidth=(2, 2)))
+
+
+def create_columns(gui, gui_root, texts_per_column):
+    """
+    Create a row of columns containing buttons with the given texts. Return the
+    columns and the buttons in each column.
+
+    """
+
+    row = Sizer("horizontal", gaps=(10, 0))
+    gui.sizer.add(row, proportions=(1., 1.))
+    columns = []
+    buttons = []
+
+    for texts in texts_per_column:
+
+        column = Sizer("vertical")
+        row.add(column, proportions=(1., 1.))
+        columns.append(column)
+        buttons.append([create_button(gui_root, text) for text in texts])
+
+        for button in buttons[-1]:
+            column.add(button, proportions=(1., 0.))
+
+    return columns, buttons
+
+
+def test_moved_cell_matches_full_layout(make_gui, gui_root):
+
+    gui = make_gui()
+    columns, buttons = create_columns(gui, gui_root, (("one", "two"), ("three",)))
+    gui.layout()
+    columns[0].move_cell(buttons[0][1].sizer_cell, columns[1], index=0)
+    gui.layout()
+    # the same layout, created with the button in its new place
+    expected_gui = make_gui()
+    _, expected_buttons = create_columns(expected_gui, gui_root,
+        (("one",), ("two", "three")))
+    expected_gui.layout()
+    moved_buttons = [buttons[0][0], buttons[0][1], buttons[1][0]]
+    expected_buttons = [button for column in expected_buttons for button in column]
+
+    assert [b.get_rect() for b in moved_buttons] == [b.get_rect() for b in expected_buttons]
+
+
+def test_moving_cell_into_and_out_of_hidden_sizer(gui, gui_root):
+
+    columns, buttons = create_columns(gui, gui_root, (("one", "two"), ("three",)))
+    hidden_cell = columns[1].sizer_cell
+    hidden_cell.shown = False
+    gui.layout()
+    button = buttons[1][0]
+
+    assert button.dgui_obj.is_stashed()
+
+    columns[1].move_cell(button.sizer_cell, columns[0])
+
+    assert not button.dgui_obj.is_stashed()
+
+    gui.layout()
+    columns[0].move_cell(button.sizer_cell, columns[1])
+
+    assert button.dgui_obj.is_stashed()
+
+    hidden_cell.shown = True
+
+    assert not button.dgui_obj.is_stashed()
+
+
+def test_moving_cell_to_other_widget(gui, gui_root):
+
+    frame = Widget(DirectFrame(parent=gui_root))
+    frame.sizer = Sizer("vertical")
+    gui.sizer.add(frame)
+    button = create_button(gui_root, "button")
+    gui.sizer.add(button)
+    gui.layout()
+    gui.sizer.move_cell(button.sizer_cell, frame.sizer)
+
+    assert button.dgui_obj.get_parent() == frame.get_content_parent()
+
+    gui.layout()
+
+    assert button.sizer_cell.sizer is frame.sizer
@@ -0,0 +1,79 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for looking up widgets, sizers and sizer cells by
+# guiId or by tag (see `Registry`).
+
+from direct.gui.DirectGui import DirectButton, DirectFrame
+from gui import Sizer, Widget
+
+
+def create_subtree(gui_root):
+    """
+    Create a sizer containing a widget with a sizer of its own, which contains
+    another widget. Return the sizer, the outer and the inner widget.
+
+    """
+
+    sizer = Sizer("vertical")
+    sizer.guiId = "subtree"
+    frame = Widget(DirectFrame(parent=gui_root))
+    frame.guiId = "frame"
+    sizer.add(frame)
+    frame.sizer = Sizer("horizontal")
+    button = Widget(DirectButton(parent=frame.dgui_obj, text="button", text_scale=20))
+    button.guiId = "button"
+    frame.sizer.add(button)
+
+    return sizer, frame, button
+
+
+def test_lookup_by_id_and_tag(gui, gui_root):
+
+    sizer, frame, button = create_subtree(gui_root)
+    cell = gui.sizer.add(sizer)
+    gui.add_tags(button, "clickable")
+
+    assert gui.get_object("button") is button
+    assert gui.get_object(cell.guiId) is cell
+    assert gui.get_tagged_objects("clickable") == [button]
+
+    button.guiId = "renamed"
+
+    assert gui.get_object("button") is None
+    assert gui.get_object("renamed") is button
+
+
+def test_removed_subtree_is_unregistered(gui, gui_root):
+
+    sizer, frame, button = create_subtree(gui_root)
+    cell = gui.sizer.add(sizer)
+    gui.add_tags(button, "clickable")
+    gui.sizer.remove_cell(cell)
+
+    for gui_id in ("subtree", "frame", "button", cell.guiId):
+        assert gui.get_object(gui_id) is None
+
+    assert gui.get_tagged_objects("clickable") == []
+    # the tags of a removed object are kept
+    assert gui.get_tags(button) == {"clickable"}
+
+    gui.sizer.add_cell(cell)
+
+    for gui_id, obj in (("subtree", sizer), ("frame", frame), ("button", button)):
+        assert gui.get_object(gui_id) is obj
+
+    assert gui.get_tagged_objects("clickable") == [button]
+
+
+def test_destroyed_subtree_is_unregistered(gui, gui_root):
+
+    sizer, frame, button = create_subtree(gui_root)
+    cell = gui.sizer.add(sizer)
+    gui.add_tags(button, "clickable")
+    gui.sizer.remove_cell(cell, destroy=True)
+
+    for gui_id in ("subtree", "frame", "button"):
+        assert gui.get_object(gui_id) is None
+
+    assert gui.get_tagged_objects("clickable") == []
@@ -0,0 +1,86 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for updating part of the layout through
+# `Sizer.relayout`.
+
+from direct.gui.DirectGui import DirectButton
+from gui import Sizer, Widget
+
+
+def create_button(parent, text):
+
+    return Widget(DirectButton(parent=parent, text=text, text_scale=20,
+        borderWidth=(2, 2)))
+
+
+def get_geometry(widgets):
+
+    return [(widget.get_pos(), widget.get_size()) for widget in widgets]
+
+
+def create_layout(gui, gui_root):
+    """
+    Create a layout whose minimum width is determined by a wide button, with a
+    row of narrower buttons below it. Return the widgets.
+
+    """
+
+    wide_button = create_button(gui_root, "a very wide button " * 4)
+    gui.sizer.add(wide_button, proportions=(1., 0.))
+    row = Sizer("horizontal", gaps=(10, 0))
+    gui.sizer.add(row, proportions=(0., 1.), alignments=("min", "expand"))
+    buttons = [create_button(gui_root, text) for text in ("one", "two", "three")]
+
+    for button in buttons:
+        row.add(button, proportions=(1., 1.))
+
+    return [wide_button] + buttons
+
+
+def test_relayout_matches_full_layout(gui, gui_root, window):
+
+    window.set_size(1000, 600)
+    widgets = create_layout(gui, gui_root)
+    gui.layout()
+    button = widgets[2]
+    button.dgui_obj["text"] = "two and more"
+    button.reset_frame_size()
+
+    # the minimum size of the row changes, but not the one of the root sizer
+    assert button.sizer_cell.sizer.relayout()
+
+    geometry = get_geometry(widgets)
+    gui.layout()
+
+    assert get_geometry(widgets) == geometry
+
+
+def test_relayout_fails_if_root_min_size_shrinks(gui, gui_root, window):
+
+    # the window is narrower than the minimum width of the layout
+    window.set_size(100, 600)
+    widgets = create_layout(gui, gui_root)
+    gui.layout()
+    wide_button = widgets[0]
+    wide_button.dgui_obj["text"] = "a narrower button"
+    wide_button.reset_frame_size()
+
+    # the root sizer would keep its previous, larger size
+    assert not gui.sizer.relayout()
+
+    gui.layout()
+
+    assert gui.sizer.get_size()[0] == gui.sizer.min_size[0]
+
+
+def test_relayout_fails_if_root_min_size_grows(gui, gui_root, window):
+
+    window.set_size(100, 600)
+    widgets = create_layout(gui, gui_root)
+    gui.layout()
+    wide_button = widgets[0]
+    wide_button.dgui_obj["text"] = "an even wider button " * 4
+    wide_button.reset_frame_size()
+
+    assert not gui.sizer.relayout()
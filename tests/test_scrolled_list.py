@@ -0,0 +1,54 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for `ScrolledListWidget`.
+
+from direct.gui.DirectGui import DirectScrolledList, DirectLabel
+from gui import ScrolledListWidget
+
+
+def create_list(gui, gui_root, item_count):
+
+    scrolled_list = DirectScrolledList(parent=gui_root, decButton_text="Dec",
+        decButton_text_scale=20, incButton_text="Inc", incButton_text_scale=20,
+        forceHeight=30)
+    list_widget = ScrolledListWidget(scrolled_list, scrollbtn_proportion=.25,
+        scrollbtn_borders=(5, 5, 10, 10), itemframe_borders=(5, 5, 0, 0),
+        margins=(10, 10))
+    items = [DirectLabel(text="item {:d}".format(i), text_scale=20)
+        for i in range(item_count)]
+
+    for item in items:
+        list_widget.add_item(item)
+
+    gui.sizer.add(list_widget, proportions=(1., 1.))
+
+    return list_widget, items
+
+
+def get_visible_items(list_widget):
+
+    dgui_obj = list_widget.dgui_obj
+    items = dgui_obj["items"]
+    index = dgui_obj.index
+
+    return list(items[index:index + dgui_obj["numItemsVisible"]])
+
+
+def test_remove_item_updates_items_in_view(gui, gui_root):
+
+    list_widget, items = create_list(gui, gui_root, 100)
+    gui.layout()
+    visible_items = get_visible_items(list_widget)
+
+    assert 0 < len(visible_items) < 100
+    assert not any(item.is_hidden() for item in visible_items)
+
+    # like `DirectScrolledList.removeItem`, the items in view get updated
+    # without a call to `GUI.layout`
+    list_widget.remove_item(visible_items[0])
+    new_visible_items = get_visible_items(list_widget)
+
+    assert new_visible_items == visible_items[1:] + [items[len(visible_items)]]
+    assert not any(item.is_hidden() for item in new_visible_items)
+    assert visible_items[0] not in list_widget.dgui_obj["items"]
@@ -0,0 +1,83 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for `StackedSizer`.
+
+from direct.gui.DirectGui import DirectButton
+from gui import Sizer, StackedSizer, Widget
+
+
+def create_button(parent, text):
+
+    return Widget(DirectButton(parent=parent, text=text, text_scale=20,
+        borderWidth=(2, 2)))
+
+
+def create_pages(gui, gui_root, min_size_policy):
+    """
+    Create a stacked sizer with two pages of different sizes, below a button.
+    Return the stacked sizer and the widgets on its pages.
+
+    """
+
+    gui.sizer.add(create_button(gui_root, "title"), proportions=(1., 0.))
+    stacked_sizer = StackedSizer(min_size_policy)
+    gui.sizer.add(stacked_sizer, proportions=(1., 1.))
+    pages = []
+
+    for texts in (("one", "two"), ("a much longer button",) * 3):
+
+        page = Sizer("vertical")
+        stacked_sizer.add(page, proportions=(1., 1.))
+        widgets = [create_button(gui_root, text) for text in texts]
+        pages.append(widgets)
+
+        for widget in widgets:
+            page.add(widget, proportions=(1., 1.))
+
+    return stacked_sizer, pages
+
+
+def get_geometry(widgets):
+
+    return [widget.get_rect() for widget in widgets]
+
+
+def test_switching_pages_matches_full_layout(gui, gui_root):
+
+    stacked_sizer, pages = create_pages(gui, gui_root, "max")
+    gui.layout()
+
+    assert stacked_sizer.set_active_page(1)
+
+    geometry = get_geometry(pages[1])
+    gui.layout()
+
+    assert get_geometry(pages[1]) == geometry
+    assert all(widget.dgui_obj.is_stashed() for widget in pages[0])
+
+    first_page_geometry = get_geometry(pages[0])
+
+    assert stacked_sizer.set_active_page(0)
+    assert get_geometry(pages[0]) == first_page_geometry
+    assert not any(widget.dgui_obj.is_stashed() for widget in pages[0])
+
+
+def test_switching_pages_fails_if_root_min_size_changes(gui, gui_root, window):
+
+    # the window is smaller than the minimum size of the layout, which depends
+    # on the active page
+    window.set_size(10, 10)
+    stacked_sizer, pages = create_pages(gui, gui_root, "active")
+    gui.layout()
+
+    assert not stacked_sizer.set_active_page(1)
+
+    gui.layout()
+
+    assert gui.sizer.get_size() == gui.sizer.min_size
+    assert not stacked_sizer.set_active_page(0)
+
+    gui.layout()
+
+    assert gui.sizer.get_size() == gui.sizer.min_size
@@ -0,0 +1,75 @@
+# Author: Epihaius
+# Date: 2026-10-19
+#
+# This module contains tests for computing the layout in a worker thread (see
+# `GUI.threaded_layout`).
+
+from direct.gui.DirectGui import DirectButton
+from direct.showbase.DirectObject import DirectObject
+from gui import Sizer, Widget
+from gui.layout_solver import solve_layout, WIDGET_SIZE
+
+
+def create_layout(gui, gui_root):
+
+    widgets = []
+
+    for i in range(4):
+
+        row = Sizer("horizontal", gaps=(5, 0))
+        gui.sizer.add(row, proportions=(1., 1.))
+
+        for j in range(i + 1):
+            widget = Widget(DirectButton(parent=gui_root, text="button " * (j + 1),
+                text_scale=20, borderWidth=(2, 2)))
+            row.add(widget, proportions=(1., 1.))
+            widgets.append(widget)
+
+    return widgets
+
+
+def get_geometry(widgets):
+
+    return [(widget.get_rect(), widget.dgui_obj["frameSize"]) for widget in widgets]
+
+
+def test_threaded_layout_matches_sync_layout(make_gui, gui_root, showbase):
+
+    sync_gui = make_gui()
+    widgets = create_layout(sync_gui, gui_root)
+    sync_gui.layout()
+    threaded_gui = make_gui()
+    threaded_widgets = create_layout(threaded_gui, gui_root)
+    threaded_gui.threaded_layout = True
+    changes = []
+    listener = DirectObject()
+    listener.accept("gui-layout-changed", changes.append)
+
+    # the layout is applied at a later frame
+    assert threaded_gui.layout() == []
+
+    for _ in range(1000):
+
+        if changes:
+            break
+
+        showbase.taskMgr.step()
+
+    listener.ignore_all()
+
+    assert changes
+
+    assert get_geometry(threaded_widgets) == get_geometry(widgets)
+
+
+def test_unchanged_widgets_are_not_resized(gui, gui_root):
+
+    create_layout(gui, gui_root)
+    gui.layout()
+    size_ops, pos_ops = solve_layout(gui.sizer.get_snapshot(), (800, 600))
+
+    assert not any(op[0] == WIDGET_SIZE for op in size_ops)
+
+    size_ops, pos_ops = solve_layout(gui.sizer.get_snapshot(), (700, 600))
+
+    assert any(op[0] == WIDGET_SIZE for op in size_ops)